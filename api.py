@@ -0,0 +1,335 @@
+"""Headless JSON API over DatabaseManager.
+
+Every GET response carries an ETag derived from the database's data version,
+so polling clients that send If-None-Match get an empty 304 until something
+is written.
+
+Usage:
+    python api.py --port 8000
+
+Endpoints:
+    GET    /applications             filtered, keyset-paginated summaries
+    POST   /applications             create an application; 409 if it duplicates
+                                     one unless ?allow_duplicate=true
+    GET    /applications/<id>        complete application
+    PUT    /applications/<id>        replace an application
+    DELETE /applications/<id>        delete an application
+    GET    /search?q=...             ranked full-text search
+    GET    /stats/metrics            counts and rates for the filtered set
+    GET    /stats/status             counts by status
+    GET    /stats/timeline           counts per day, week or month
+    GET    /stats/companies          top companies
+    GET    /stats/salaries           salary histogram in one currency
+    GET    /stats/funnel             pipeline funnel and median days per stage
+    GET    /applications/<id>/history  status changes, oldest first
+    GET    /duplicates               groups of applications that look the same
+    GET    /autocomplete?field=...&q=...  stored companies, titles or locations
+
+List and stats endpoints accept search, status (repeatable), date_from,
+date_to, salary_currency, salary_min and salary_max filters; /applications
+also takes page_size, after_date and after_id.
+"""
+import argparse
+import json
+import re
+import sys
+import uuid
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import pandas as pd
+from database import DatabaseManager, TIMELINE_BUCKET_SQL
+from models import ApplicationFilters, JobApplication
+from autocomplete import AUTOCOMPLETE_FIELDS
+from config import APPLICATIONS_PAGE_SIZE, AUTOCOMPLETE_LIMIT
+
+# Changes on every start, so ETags from a previous process never match
+_INSTANCE = uuid.uuid4().hex[:8]
+
+MAX_PAGE_SIZE = 500
+MAX_BODY_BYTES = 1024 * 1024
+
+class APIError(Exception):
+    def __init__(self, status: HTTPStatus, message: str):
+        super().__init__(message)
+        self.status = status
+
+# Datetime columns are serialized in the same text format SQLite stores them in
+DATE_ONLY_COLUMNS = ('application_date', 'period', 'first_applied', 'last_applied')
+
+def _records(df: pd.DataFrame) -> list:
+    df = df.assign(**{
+        column: df[column].dt.strftime('%Y-%m-%d' if column in DATE_ONLY_COLUMNS else '%Y-%m-%d %H:%M:%S')
+        for column in df.select_dtypes('datetime').columns
+    })
+    return json.loads(df.to_json(orient='records'))
+
+def _int_param(query: dict, name: str, default=None, minimum: int = None):
+    value = query.get(name, [None])[0]
+    if value is None:
+        return default
+    try:
+        value = int(value)
+    except ValueError:
+        raise APIError(HTTPStatus.BAD_REQUEST, f"'{name}' must be an integer")
+    if minimum is not None and value < minimum:
+        raise APIError(HTTPStatus.BAD_REQUEST, f"'{name}' must be at least {minimum}")
+    return value
+
+def _float_param(query: dict, name: str):
+    value = query.get(name, [None])[0]
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise APIError(HTTPStatus.BAD_REQUEST, f"'{name}' must be a number")
+
+def filters_from_query(query: dict) -> ApplicationFilters:
+    """Build filters from query parameters; status may repeat or be comma-separated."""
+    statuses = [status for value in query.get('status', []) for status in value.split(',') if status]
+    salary_currency = query.get('salary_currency', [None])[0] or None
+    return ApplicationFilters(
+        search=query.get('search', [None])[0] or None,
+        statuses=statuses or None,
+        date_from=query.get('date_from', [None])[0] or None,
+        date_to=query.get('date_to', [None])[0] or None,
+        salary_currency=salary_currency.upper() if salary_currency else None,
+        salary_min=_float_param(query, 'salary_min'),
+        salary_max=_float_param(query, 'salary_max')
+    )
+
+class APIHandler(BaseHTTPRequestHandler):
+    db_manager: DatabaseManager = None
+    server_version = 'ApplicationTrackerAPI/1.0'
+
+    routes = [
+        ('GET', re.compile(r'^/applications$'), 'list_applications'),
+        ('POST', re.compile(r'^/applications$'), 'create_application'),
+        ('GET', re.compile(r'^/applications/(\d+)$'), 'get_application'),
+        ('PUT', re.compile(r'^/applications/(\d+)$'), 'update_application'),
+        ('DELETE', re.compile(r'^/applications/(\d+)$'), 'delete_application'),
+        ('GET', re.compile(r'^/search$'), 'search'),
+        ('GET', re.compile(r'^/stats/metrics$'), 'metrics'),
+        ('GET', re.compile(r'^/stats/status$'), 'status_counts'),
+        ('GET', re.compile(r'^/stats/timeline$'), 'timeline'),
+        ('GET', re.compile(r'^/stats/companies$'), 'companies'),
+        ('GET', re.compile(r'^/stats/salaries$'), 'salaries'),
+        ('GET', re.compile(r'^/stats/funnel$'), 'funnel'),
+        ('GET', re.compile(r'^/applications/(\d+)/history$'), 'history'),
+        ('GET', re.compile(r'^/duplicates$'), 'duplicates'),
+        ('GET', re.compile(r'^/autocomplete$'), 'autocomplete'),
+    ]
+
+    def do_GET(self):
+        self._dispatch('GET')
+
+    def do_POST(self):
+        self._dispatch('POST')
+
+    def do_PUT(self):
+        self._dispatch('PUT')
+
+    def do_DELETE(self):
+        self._dispatch('DELETE')
+
+    def _dispatch(self, method: str):
+        url = urlsplit(self.path)
+        query = parse_qs(url.query)
+        allowed = []
+        try:
+            for route_method, pattern, handler in self.routes:
+                match = pattern.match(url.path)
+                if not match:
+                    continue
+                if route_method != method:
+                    allowed.append(route_method)
+                    continue
+
+                if method == 'GET':
+                    # Answer conditional requests before running any query
+                    etag = self._etag()
+                    if self._etag_matches(etag):
+                        self._send(HTTPStatus.NOT_MODIFIED, etag=etag)
+                        return
+                    body = getattr(self, handler)(query, *match.groups())
+                    self._send(HTTPStatus.OK, body, etag=etag)
+                else:
+                    status, body = getattr(self, handler)(query, *match.groups())
+                    self._send(status, body)
+                return
+
+            if allowed:
+                raise APIError(HTTPStatus.METHOD_NOT_ALLOWED, f"Use {', '.join(allowed)} for {url.path}")
+            raise APIError(HTTPStatus.NOT_FOUND, f"No route for {url.path}")
+        except APIError as e:
+            self._send(e.status, {'error': str(e)})
+        except Exception as e:
+            self.log_error("Unhandled error: %r", e)
+            self._send(HTTPStatus.INTERNAL_SERVER_ERROR, {'error': 'Internal server error'})
+
+    def _etag(self) -> str:
+        return f'"{_INSTANCE}-{self.db_manager.pool.data_version()}"'
+
+    def _etag_matches(self, etag: str) -> bool:
+        header = self.headers.get('If-None-Match')
+        if not header:
+            return False
+        candidates = [candidate.strip() for candidate in header.split(',')]
+        return '*' in candidates or any(
+            candidate.removeprefix('W/') == etag for candidate in candidates
+        )
+
+    def _send(self, status: HTTPStatus, body=None, etag: str = None):
+        payload = b'' if body is None else json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        if etag:
+            self.send_header('ETag', etag)
+            self.send_header('Cache-Control', 'no-cache')
+        if status not in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if payload and status not in (HTTPStatus.NO_CONTENT, HTTPStatus.NOT_MODIFIED):
+            self.wfile.write(payload)
+
+    def _read_application(self) -> JobApplication:
+        length = int(self.headers.get('Content-Length') or 0)
+        if length > MAX_BODY_BYTES:
+            raise APIError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large")
+        try:
+            data = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}")
+        if not isinstance(data, dict):
+            raise APIError(HTTPStatus.BAD_REQUEST, "Body must be a JSON object")
+        try:
+            return JobApplication.from_dict(data)
+        except ValueError as e:
+            raise APIError(HTTPStatus.BAD_REQUEST, str(e))
+
+    def list_applications(self, query):
+        page_size = min(_int_param(query, 'page_size', APPLICATIONS_PAGE_SIZE, minimum=1), MAX_PAGE_SIZE)
+        after_date = query.get('after_date', [None])[0]
+        after_id = _int_param(query, 'after_id')
+        after = (after_date, after_id) if after_date and after_id is not None else None
+        page, next_cursor = self.db_manager.get_applications_page(
+            filters_from_query(query), page_size, after
+        )
+        return {
+            'items': _records(page),
+            'next': {'after_date': next_cursor[0], 'after_id': next_cursor[1]} if next_cursor else None
+        }
+
+    def create_application(self, query):
+        application = self._read_application()
+        if query.get('allow_duplicate', ['false'])[0].lower() not in ('1', 'true', 'yes'):
+            duplicates = self.db_manager.find_duplicates(application)
+            if duplicates:
+                return HTTPStatus.CONFLICT, {
+                    'error': 'Application duplicates an existing one',
+                    'duplicates': [duplicate.id for duplicate in duplicates]
+                }
+        application_id = self.db_manager.add_application(application)
+        return HTTPStatus.CREATED, {'id': application_id}
+
+    def get_application(self, query, application_id):
+        application = self.db_manager.get_application(int(application_id))
+        if application is None:
+            raise APIError(HTTPStatus.NOT_FOUND, f"Application {application_id} not found")
+        return application.to_dict()
+
+    def update_application(self, query, application_id):
+        if not self.db_manager.update_application(int(application_id), self._read_application()):
+            raise APIError(HTTPStatus.NOT_FOUND, f"Application {application_id} not found")
+        return HTTPStatus.OK, {'id': int(application_id)}
+
+    def delete_application(self, query, application_id):
+        if not self.db_manager.delete_application(int(application_id)):
+            raise APIError(HTTPStatus.NOT_FOUND, f"Application {application_id} not found")
+        return HTTPStatus.NO_CONTENT, None
+
+    def search(self, query):
+        text = query.get('q', [''])[0]
+        limit = min(_int_param(query, 'limit', 50, minimum=1), MAX_PAGE_SIZE)
+        return {'items': _records(self.db_manager.search_applications(text, limit))}
+
+    def metrics(self, query):
+        return self.db_manager.get_metrics(filters_from_query(query))
+
+    def status_counts(self, query):
+        return self.db_manager.get_status_counts()
+
+    def timeline(self, query):
+        bucket = query.get('bucket', ['day'])[0]
+        if bucket not in TIMELINE_BUCKET_SQL:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"bucket must be one of {', '.join(TIMELINE_BUCKET_SQL)}")
+        return {'bucket': bucket, 'items': _records(
+            self.db_manager.get_timeline_counts(filters_from_query(query), bucket)
+        )}
+
+    def companies(self, query):
+        limit = min(_int_param(query, 'limit', 10, minimum=1), MAX_PAGE_SIZE)
+        return self.db_manager.get_company_counts(filters_from_query(query), limit)
+
+    def salaries(self, query):
+        filters = filters_from_query(query)
+        currency = filters.salary_currency or next(iter(self.db_manager.get_salary_currencies()), None)
+        bins = min(max(_int_param(query, 'bins', 20), 1), 200)
+        return {'currency': currency, 'items': _records(
+            self.db_manager.get_salary_histogram(filters, currency, bins)
+        )}
+
+    def funnel(self, query):
+        filters = filters_from_query(query)
+        return {
+            'stages': _records(self.db_manager.get_funnel(filters)),
+            'time_in_stage': _records(self.db_manager.get_time_in_stage(filters))
+        }
+
+    def history(self, query, application_id):
+        if self.db_manager.get_application(int(application_id)) is None:
+            raise APIError(HTTPStatus.NOT_FOUND, f"Application {application_id} not found")
+        return [
+            {'status': status, 'changed_at': changed_at}
+            for status, changed_at in self.db_manager.get_status_history(int(application_id))
+        ]
+
+    def duplicates(self, query):
+        min_count = max(_int_param(query, 'min_count', 2), 2)
+        report = self.db_manager.get_duplicate_report(min_count)
+        return {'items': _records(report)}
+
+    def autocomplete(self, query):
+        field = query.get('field', ['company_name'])[0]
+        if field not in AUTOCOMPLETE_FIELDS:
+            raise APIError(HTTPStatus.BAD_REQUEST, f"field must be one of {', '.join(AUTOCOMPLETE_FIELDS)}")
+        limit = min(_int_param(query, 'limit', AUTOCOMPLETE_LIMIT, minimum=1), MAX_PAGE_SIZE)
+        return self.db_manager.get_suggestions(field, query.get('q', [''])[0], limit)
+
+def create_server(host: str = '127.0.0.1', port: int = 8000,
+                  db_manager: DatabaseManager = None) -> ThreadingHTTPServer:
+    """Create (but don't start) an API server bound to host:port."""
+    handler = type('BoundAPIHandler', (APIHandler,), {'db_manager': db_manager or DatabaseManager()})
+    return ThreadingHTTPServer((host, port), handler)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the job applications as a JSON API.")
+    parser.add_argument('--host', default='127.0.0.1', help="Interface to bind")
+    parser.add_argument('--port', type=int, default=8000, help="Port to listen on")
+    parser.add_argument('--database', help="Database file (defaults to config.DATABASE_PATH)")
+    args = parser.parse_args(argv)
+
+    db_manager = DatabaseManager(args.database) if args.database else DatabaseManager()
+    server = create_server(args.host, args.port, db_manager)
+    print(f"Serving on http://{args.host}:{args.port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,19 +6,25 @@ import plotly.graph_objects as go
 
 # Import our modules
 from database import DatabaseManager
-from models import JobApplication
+from models import ApplicationFilters, JobApplication
 from utils import (
     create_status_chart, 
     create_timeline_chart, 
     create_company_chart,
-    filter_dataframe,
-    export_to_csv,
-    calculate_metrics
+    create_salary_chart,
+    create_funnel_chart,
+    choose_timeline_bucket,
+    run_concurrently,
+    export_csv_stream,
+    figure_cache_stats
 )
+from instrumentation import start_trace, finish_trace, span, latency_summary
 from config import (
     PAGE_TITLE, 
     PAGE_ICON, 
     LAYOUT, 
+    APPLICATIONS_PAGE_SIZE,
+    AUTOCOMPLETE_FORM_OPTIONS,
     STATUS_OPTIONS,
     STATUS_COLORS
 )
@@ -76,10 +82,15 @@ def init_session_state():
     
     if 'edit_application' not in st.session_state:
         st.session_state.edit_application = None
+    
+    if 'page_cursors' not in st.session_state:
+        st.session_state.page_cursors = [None]
+        st.session_state.page_filters = None
 
 def main():
     """Main application function."""
     init_session_state()
+    trace = start_trace()
     
     # Header
     st.markdown("""
@@ -102,7 +113,7 @@ def main():
         # Filters
         st.subheader("🔍 Filters")
         
-        search_term = st.text_input("Search", placeholder="Search by title, company, or location...")
+        search_term = st.text_input("Search", placeholder="Search titles, companies, locations, descriptions, notes...")
         
         status_filter = st.multiselect(
             "Filter by Status",
@@ -116,34 +127,102 @@ def main():
             key="date_filter"
         )
         
+        archive = st.session_state.db_manager.get_archive_stats()
+        if archive['archived']:
+            st.caption(
+                f"📦 {archive['archived']:,} closed applications through {archive['horizon']} are archived; "
+                "start the range on or before that date to include them."
+            )
+        
+        salary_currencies = st.session_state.db_manager.get_salary_currencies()
+        salary_currency = st.selectbox(
+            "Salary Currency",
+            options=["Any"] + list(salary_currencies)
+        )
+        salary_range = None
+        if salary_currency != "Any":
+            low, high = st.session_state.db_manager.get_salary_span(salary_currency)
+            if low is not None and high > low:
+                salary_range = st.slider(
+                    "Annual Salary",
+                    min_value=float(low),
+                    max_value=float(high),
+                    value=(float(low), float(high)),
+                    step=1000.0,
+                    format="%.0f",
+                    key=f"salary_filter_{salary_currency}"
+                )
+        else:
+            salary_currency = None
+        
+        filters = ApplicationFilters.from_inputs(
+            search_term, status_filter, date_range, salary_currency, salary_range
+        )
+        
+        timeline_granularity = st.selectbox(
+            "Timeline Granularity",
+            options=["Auto", "Day", "Week", "Month"]
+        )
+        
+        st.markdown("---")
+        
+        show_debug = st.checkbox("⏱️ Show performance panel")
+        
         st.markdown("---")
         
         # Export functionality
         st.subheader("📁 Export Data")
+        export_filtered = st.checkbox("Only current filtered view")
+        compress_export = st.checkbox("Gzip compress")
         if st.button("Export to CSV", use_container_width=True):
-            df = st.session_state.db_manager.get_applications_df()
-            csv = export_to_csv(df)
-            st.download_button(
-                label="Download CSV",
-                data=csv,
-                file_name=f"job_applications_{datetime.now().strftime('%Y%m%d')}.csv",
-                mime="text/csv",
-                use_container_width=True
+            export_file = export_csv_stream(
+                st.session_state.db_manager,
+                filters if export_filtered else None,
+                compress=compress_export
             )
+            file_name = f"job_applications_{datetime.now().strftime('%Y%m%d')}.csv"
+            with export_file:
+                st.download_button(
+                    label="Download CSV",
+                    data=export_file.read(),
+                    file_name=file_name + ".gz" if compress_export else file_name,
+                    mime="application/gzip" if compress_export else "text/csv",
+                    use_container_width=True
+                )
     
-    # Load data
-    applications = st.session_state.db_manager.get_all_applications()
-    df = st.session_state.db_manager.get_applications_df()
+    # Load the dashboard data concurrently, then build the figures concurrently
+    db_manager = st.session_state.db_manager
+    page_cursor = current_page_cursor(filters)
+    # Salaries can only be binned within one currency; default to the most common
+    chart_currency = filters.salary_currency or next(iter(salary_currencies), None)
     
-    # Apply filters
-    if not df.empty:
-        df = filter_dataframe(df, search_term, status_filter, date_range)
+    with span('load.data'):
+        data = run_concurrently({
+            'metrics': lambda: db_manager.get_metrics(filters),
+            'timeline': lambda: load_timeline(db_manager, filters, timeline_granularity),
+            'company_counts': lambda: db_manager.get_company_counts(filters),
+            'salary_histogram': lambda: db_manager.get_salary_histogram(filters, chart_currency),
+            'funnel': lambda: db_manager.get_funnel(filters),
+            'time_in_stage': lambda: db_manager.get_time_in_stage(filters),
+            'page': lambda: db_manager.get_applications_page(filters, APPLICATIONS_PAGE_SIZE, page_cursor)
+        }, stage='load')
     
-    # Dashboard metrics
-    col1, col2, col3, col4 = st.columns(4)
+    metrics = data['metrics']
+    timeline, bucket = data['timeline']
+    has_applications = metrics['total_applications'] > 0
     
-    metrics = calculate_metrics(df)
-    status_counts = st.session_state.db_manager.get_status_counts()
+    if has_applications:
+        with span('build.charts'):
+            charts = run_concurrently({
+                'status': lambda: create_status_chart(metrics['status_counts']),
+                'timeline': lambda: create_timeline_chart(timeline, bucket),
+                'company': lambda: create_company_chart(data['company_counts']),
+                'salary': lambda: create_salary_chart(data['salary_histogram'], chart_currency),
+                'funnel': lambda: create_funnel_chart(data['funnel'], data['time_in_stage'])
+            }, stage='chart')
+    
+    # Dashboard metrics and status breakdown for the filtered applications
+    col1, col2, col3, col4 = st.columns(4)
     
     with col1:
         st.metric("Total Applications", metrics['total_applications'])
@@ -158,23 +237,36 @@ def main():
         st.metric("Offer Rate", f"{metrics['offer_rate']:.1f}%")
     
     # Charts
-    if not df.empty:
+    if has_applications:
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            if charts['status']:
+                with span('render.status_chart'):
+                    st.plotly_chart(charts['status'], use_container_width=True)
+        
+        with col2:
+            if charts['timeline']:
+                with span('render.timeline_chart'):
+                    st.plotly_chart(charts['timeline'], use_container_width=True)
+        
+        # Company and salary charts
         col1, col2 = st.columns(2)
         
         with col1:
-            status_chart = create_status_chart(status_counts)
-            if status_chart:
-                st.plotly_chart(status_chart, use_container_width=True)
+            if charts['company']:
+                with span('render.company_chart'):
+                    st.plotly_chart(charts['company'], use_container_width=True)
         
         with col2:
-            timeline_chart = create_timeline_chart(df)
-            if timeline_chart:
-                st.plotly_chart(timeline_chart, use_container_width=True)
+            if charts['salary']:
+                with span('render.salary_chart'):
+                    st.plotly_chart(charts['salary'], use_container_width=True)
         
-        # Company applications chart
-        company_chart = create_company_chart(df)
-        if company_chart:
-            st.plotly_chart(company_chart, use_container_width=True)
+        # Pipeline funnel from the status history
+        if charts['funnel']:
+            with span('render.funnel_chart'):
+                st.plotly_chart(charts['funnel'], use_container_width=True)
     
     # Add/Edit Application Form
     if st.session_state.show_add_form or st.session_state.edit_application:
@@ -183,11 +275,19 @@ def main():
     # Applications table
     st.subheader("📋 Your Applications")
     
-    if not df.empty:
-        # Display applications
-        display_applications_table(df)
+    if has_applications:
+        # Display the current page of applications
+        with span('table.page'):
+            display_applications_page(*data['page'])
     else:
         st.info("No applications found. Add your first application to get started!")
+    
+    show_duplicate_report(db_manager)
+    
+    finish_trace(trace)
+    if show_debug:
+        show_debug_panel(trace)
+    
     # Stylish Footer
     st.markdown("---")
     st.markdown("""
@@ -240,35 +340,100 @@ def main():
     </style>
     """, unsafe_allow_html=True)
 
+def show_debug_panel(trace):
+    """Display stage timings for this rerun and recent latency percentiles."""
+    summary = latency_summary()
+    cache = st.session_state.db_manager.cache_stats()
+    figures = figure_cache_stats()
+    
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        st.caption(
+            f"This rerun: {trace.total_ms:.1f} ms · "
+            f"p50 {summary['p50_ms']:.1f} ms · p95 {summary['p95_ms']:.1f} ms "
+            f"over {summary['reruns']} reruns"
+        )
+        st.caption(
+            f"Query cache: {cache['hits']} hits, {cache['misses']} misses "
+            f"({cache['hit_rate']:.0f}%), {cache['entries']}/{cache['max_entries']} entries"
+        )
+        st.caption(
+            f"Figure cache: {figures['hits']} hits, {figures['misses']} misses "
+            f"({figures['hit_rate']:.0f}%), {figures['entries']}/{figures['max_entries']} entries"
+        )
+        writer = st.session_state.db_manager.writer
+        if writer is not None:
+            writes = writer.stats()
+            st.caption(
+                f"Write-behind: {writes['operations']} writes in {writes['batches']} batches "
+                f"(mean {writes['batch_size_mean']:.1f}), queue p95 {writes['latency_p95_ms']:.1f} ms, "
+                f"{writes['pending']} pending"
+            )
+        
+        spans = sorted(trace.spans, key=lambda s: s.start_ms)
+        st.dataframe(
+            pd.DataFrame([{
+                'Stage': '· ' * s.depth + s.name,
+                'ms': round(s.duration_ms, 2),
+                'Rows': s.rows,
+                'Cache': s.attributes.get('cache', '')
+            } for s in spans]),
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        queries = [s for s in spans if s.sql]
+        if queries:
+            selected = st.selectbox(
+                "SQL for query",
+                options=range(len(queries)),
+                format_func=lambda i: queries[i].name,
+                key="debug_sql_span"
+            )
+            st.code(';\n'.join(queries[selected].sql), language='sql')
+
+def suggestion_select(label: str, field: str, current, placeholder: str):
+    """Dropdown of stored values, most used first, that also accepts a new value."""
+    options = st.session_state.db_manager.get_suggestions(field, limit=AUTOCOMPLETE_FORM_OPTIONS)
+    if current and current not in options:
+        options = [current] + options
+    return st.selectbox(
+        label,
+        options=options,
+        index=options.index(current) if current else None,
+        placeholder=placeholder,
+        accept_new_options=True
+    )
+
 def show_application_form():
     """Display the add/edit application form."""
     is_editing = st.session_state.edit_application is not None
     title = "✏️ Edit Application" if is_editing else "➕ Add New Application"
     
     with st.expander(title, expanded=True):
-        with st.form("application_form", clear_on_submit=not is_editing):
+        # Values are kept on submit so a duplicate warning doesn't discard them
+        with st.form("application_form"):
             col1, col2 = st.columns(2)
             
             # Get current values if editing
             current_app = st.session_state.edit_application if is_editing else None
             
             with col1:
-                job_title = st.text_input(
-                    "Job Title *",
-                    value=current_app.job_title if current_app else "",
-                    placeholder="e.g., Software Engineer"
+                job_title = suggestion_select(
+                    "Job Title *", 'job_title',
+                    current_app.job_title if current_app else None,
+                    "e.g., Software Engineer"
                 )
                 
-                company_name = st.text_input(
-                    "Company Name *",
-                    value=current_app.company_name if current_app else "",
-                    placeholder="e.g., Google"
+                company_name = suggestion_select(
+                    "Company Name *", 'company_name',
+                    current_app.company_name if current_app else None,
+                    "e.g., Google"
                 )
                 
-                location = st.text_input(
-                    "Location *",
-                    value=current_app.location if current_app else "",
-                    placeholder="e.g., San Francisco, CA"
+                location = suggestion_select(
+                    "Location *", 'location',
+                    current_app.location if current_app else None,
+                    "e.g., San Francisco, CA"
                 )
                 
                 salary_range = st.text_input(
@@ -301,6 +466,11 @@ def show_application_form():
                     placeholder="Any additional notes..."
                 )
             
+            allow_duplicate = st.checkbox(
+                "Save even if it matches an existing application",
+                help="Matching ignores case, punctuation, legal suffixes like Inc. and abbreviations like Sr."
+            )
+            
             # Form buttons
             col1, col2, col3 = st.columns([1, 1, 2])
             
@@ -331,7 +501,19 @@ def show_application_form():
                         notes=notes if notes else None
                     )
                     
-                    if is_editing:
+                    duplicates = [] if allow_duplicate else st.session_state.db_manager.find_duplicates(
+                        application, exclude_id=current_app.id if current_app else None
+                    )
+                    if duplicates:
+                        st.warning(
+                            f"This looks like {len(duplicates)} existing application(s): " +
+                            "; ".join(
+                                f"{d.job_title} at {d.company_name}, {d.location} ({d.application_date}, {d.status})"
+                                for d in duplicates[:3]
+                            ) +
+                            ". Tick the box above to save it anyway."
+                        )
+                    elif is_editing:
                         success = st.session_state.db_manager.update_application(current_app.id, application)
                         if success:
                             st.success("Application updated successfully!")
@@ -346,7 +528,8 @@ def show_application_form():
                         else:
                             st.error("Failed to add application.")
                     
-                    st.rerun()
+                    if not duplicates:
+                        st.rerun()
                 else:
                     st.error("Please fill in all required fields marked with *")
             
@@ -355,6 +538,73 @@ def show_application_form():
                 st.session_state.edit_application = None
                 st.rerun()
 
+def show_duplicate_report(db_manager):
+    """List groups of applications with the same normalized company, title and location."""
+    with span('load.duplicates'):
+        report = db_manager.get_duplicate_report()
+    if report.empty:
+        return
+    
+    with st.expander(f"🔁 Possible duplicates ({len(report)} groups)"):
+        st.dataframe(
+            report.drop(columns='dedup_hash').assign(ids=report['ids'].map(lambda ids: ', '.join(map(str, ids)))),
+            column_config={
+                'company_name': 'Company',
+                'job_title': 'Job Title',
+                'location': 'Location',
+                'count': 'Entries',
+                'first_applied': st.column_config.DateColumn('First Applied'),
+                'last_applied': st.column_config.DateColumn('Last Applied'),
+                'ids': 'IDs'
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+
+def load_timeline(db_manager, filters: ApplicationFilters, granularity: str):
+    """Load timeline counts, picking the bucket size from the date span when set to Auto."""
+    if granularity == "Auto":
+        date_from, date_to = filters.date_from, filters.date_to
+        if not (date_from and date_to):
+            date_from, date_to = db_manager.get_date_span()
+        bucket = choose_timeline_bucket(date_from, date_to)
+    else:
+        bucket = granularity.lower()
+    return db_manager.get_timeline_counts(filters, bucket), bucket
+
+def current_page_cursor(filters: ApplicationFilters):
+    """Get the keyset cursor of the page being viewed, resetting it when filters change."""
+    if st.session_state.page_filters != filters:
+        st.session_state.page_filters = filters
+        st.session_state.page_cursors = [None]
+    return st.session_state.page_cursors[-1]
+
+def display_applications_page(page_df: pd.DataFrame, next_cursor):
+    """Display one keyset-paginated page of the filtered applications."""
+    cursors = st.session_state.page_cursors
+    
+    # The last rows of a page may have been deleted; step back a page
+    if page_df.empty and len(cursors) > 1:
+        cursors.pop()
+        st.rerun()
+    
+    col1, col2, col3 = st.columns([1, 2, 1])
+    
+    with col1:
+        if st.button("← Previous", disabled=len(cursors) == 1, use_container_width=True):
+            cursors.pop()
+            st.rerun()
+    
+    with col2:
+        st.caption(f"Page {len(cursors)} · {len(page_df)} applications shown")
+    
+    with col3:
+        if st.button("Next →", disabled=next_cursor is None, use_container_width=True):
+            cursors.append(next_cursor)
+            st.rerun()
+    
+    display_applications_table(page_df)
+
 def display_applications_table(df):
     """Display the applications table with action buttons."""
     # Configure columns for display
@@ -363,40 +613,37 @@ def display_applications_table(df):
         'application_date', 'status', 'salary_range'
     ]
     
-    # Create a copy for display
-    display_df = df[display_columns].copy()
-    display_df.columns = [
+    # Dates are already datetime64, which DateColumn renders directly
+    display_df = df[display_columns].set_axis([
         'Job Title', 'Company', 'Location', 
         'Date', 'Status', 'Salary Range'
-    ]
-    
-    # Format date
-    display_df['Date'] = pd.to_datetime(display_df['Date']).dt.strftime('%Y-%m-%d')
+    ], axis=1)
     
     # Display table
-    st.dataframe(
-        display_df,
-        use_container_width=True,
-        hide_index=True,
-        column_config={
-            "Status": st.column_config.TextColumn(
-                "Status",
-                width="small",
-            ),
-            "Date": st.column_config.DateColumn(
-                "Date",
-                width="small"
-            ),
-            "Job Title": st.column_config.TextColumn(
-                "Job Title",
-                width="medium"
-            ),
-            "Company": st.column_config.TextColumn(
-                "Company", 
-                width="medium"
-            )
-        }
-    )
+    with span('render.dataframe', rows=len(display_df)):
+        st.dataframe(
+            display_df,
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "Status": st.column_config.TextColumn(
+                    "Status",
+                    width="small",
+                ),
+                "Date": st.column_config.DateColumn(
+                    "Date",
+                    width="small"
+                ),
+                "Job Title": st.column_config.TextColumn(
+                    "Job Title",
+                    width="medium"
+                ),
+                "Company": st.column_config.TextColumn(
+                    "Company", 
+                    width="medium"
+                )
+            }
+        )
     
     # Action buttons
     st.subheader("🔧 Actions")
@@ -418,10 +665,13 @@ def display_applications_table(df):
             )
         
         with col2:
-            if st.button("Edit", use_container_width=True):
+            # Archived applications are read-only, so only offer Delete for them
+            archived = st.session_state.db_manager.is_archived(application_options[selected_app])
+            if st.button("Edit", use_container_width=True, disabled=archived,
+                         help="Archived applications can't be edited" if archived else None):
                 app_id = application_options[selected_app]
-                applications = st.session_state.db_manager.get_all_applications()
-                selected_application = next((app for app in applications if app.id == app_id), None)
+                # Description and notes are only loaded when a record is opened
+                selected_application = st.session_state.db_manager.get_application(app_id)
                 if selected_application:
                     st.session_state.edit_application = selected_application
                     st.rerun()
@@ -0,0 +1,40 @@
+"""Move old closed applications from the hot table into the archive tier.
+
+Applications whose status is one of ARCHIVE_STATUSES and whose application
+date is more than --older-than-days ago are moved in batches into the archive
+file next to the database (job_applications_archive.db by default). The
+dashboard reads the archive only when its date filter overlaps the archived
+dates; snapshots, DataFrames, full exports and search always include it. Run
+it periodically, e.g. from cron.
+
+Usage:
+    python archive.py
+    python archive.py --older-than-days 730 --batch-size 5000
+"""
+import argparse
+import sys
+import time
+from database import DatabaseManager
+from config import ARCHIVE_AFTER_DAYS, ARCHIVE_BATCH_SIZE, ARCHIVE_STATUSES
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Archive old closed job applications.")
+    parser.add_argument('--older-than-days', type=int, default=ARCHIVE_AFTER_DAYS,
+                        help="Archive applications dated more than this many days ago")
+    parser.add_argument('--batch-size', type=int, default=ARCHIVE_BATCH_SIZE,
+                        help="Rows moved per transaction")
+    parser.add_argument('--database', help="Database file (defaults to config.DATABASE_PATH)")
+    args = parser.parse_args(argv)
+
+    db_manager = DatabaseManager(args.database) if args.database else DatabaseManager()
+    start = time.perf_counter()
+    moved = db_manager.archive_closed_applications(args.older_than_days, args.batch_size)
+    elapsed = time.perf_counter() - start
+    stats = db_manager.get_archive_stats()
+    print(f"Archived {moved} {'/'.join(ARCHIVE_STATUSES)} applications in {elapsed:.2f}s; "
+          f"{stats['hot']} hot, {stats['archived']} archived (through {stats['horizon'] or 'n/a'}) "
+          f"in {db_manager.archive_path}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
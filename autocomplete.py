@@ -0,0 +1,127 @@
+"""In-memory prefix index over distinct company names, job titles and locations.
+
+Each distinct value is stored once per word it contains, as a lower-cased
+key starting at that word, in a sorted list. A prefix lookup is a bisect to
+the first key at or after the prefix followed by a scan while keys still
+start with it, so "eng" finds "Software Engineer" as well as "Engineering
+Manager". Matches are ranked by how many applications use the value.
+"""
+import threading
+from bisect import bisect_left, insort
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Tuple
+
+AUTOCOMPLETE_FIELDS = ('company_name', 'job_title', 'location')
+
+def _fold(text: str) -> str:
+    return ' '.join(text.casefold().split())
+
+def _word_keys(value: str) -> List[str]:
+    """Keys for a value: its folded text starting at each word."""
+    words = _fold(value).split(' ')
+    return [' '.join(words[start:]) for start in range(len(words))]
+
+class PrefixIndex:
+    """Sorted (key, value) entries with per-value usage counts.
+
+    Not thread-safe on its own; AutocompleteIndex serializes access.
+    """
+
+    def __init__(self):
+        self._entries: List[Tuple[str, str]] = []
+        self.counts: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def load(self, counts: Dict[str, int]):
+        """Replace the index with values and their counts, sorting once."""
+        self.counts = Counter({value: count for value, count in counts.items() if value and count > 0})
+        self._entries = sorted((key, value) for value in self.counts for key in _word_keys(value))
+
+    def add(self, value: str, count: int = 1):
+        if not value:
+            return
+        if value not in self.counts:
+            for key in _word_keys(value):
+                insort(self._entries, (key, value))
+        self.counts[value] += count
+
+    def remove(self, value: str, count: int = 1):
+        if value not in self.counts:
+            return
+        self.counts[value] -= count
+        if self.counts[value] > 0:
+            return
+        del self.counts[value]
+        for key in _word_keys(value):
+            position = bisect_left(self._entries, (key, value))
+            if position < len(self._entries) and self._entries[position] == (key, value):
+                del self._entries[position]
+
+    def suggest(self, prefix: str, limit: Optional[int] = None) -> List[str]:
+        """Get up to `limit` values with a word starting with `prefix`, most used first."""
+        prefix = _fold(prefix)
+        if not prefix:
+            return self.most_common(limit)
+        matches = set()
+        position = bisect_left(self._entries, (prefix, ''))
+        while position < len(self._entries) and self._entries[position][0].startswith(prefix):
+            matches.add(self._entries[position][1])
+            position += 1
+        return sorted(matches, key=lambda value: (-self.counts[value], len(value), value))[:limit]
+
+    def most_common(self, limit: Optional[int] = None) -> List[str]:
+        return [value for value, _ in self.counts.most_common(limit)]
+
+class AutocompleteIndex:
+    """Thread-safe prefix indexes for each autocomplete field, shared by all sessions.
+
+    The index starts empty and is loaded from the database on first use;
+    until then add/remove calls are ignored, since the load will include them.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._indexes = {field: PrefixIndex() for field in AUTOCOMPLETE_FIELDS}
+        self.loaded = False
+        # Applications counted and the data version last checked, to spot
+        # writes made by other processes
+        self.rows = 0
+        self.version = None
+        # Held while loading, so concurrent sessions don't all read the table
+        self.refresh_lock = threading.Lock()
+
+    def load(self, counts: Dict[str, Dict[str, int]], rows: int):
+        with self._lock:
+            for field, index in self._indexes.items():
+                index.load(counts.get(field, {}))
+            self.rows = rows
+            self.loaded = True
+
+    def apply(self, removed: Iterable[Tuple[str, str, str]] = (),
+              added: Iterable[Tuple[str, str, str]] = ()):
+        """Update counts for committed writes; values are (company_name, job_title, location)."""
+        with self._lock:
+            if not self.loaded:
+                return
+            for values in removed:
+                for field, value in zip(AUTOCOMPLETE_FIELDS, values):
+                    self._indexes[field].remove(value)
+                self.rows -= 1
+            for values in added:
+                for field, value in zip(AUTOCOMPLETE_FIELDS, values):
+                    self._indexes[field].add(value)
+                self.rows += 1
+
+    def suggest(self, field: str, prefix: str, limit: Optional[int] = None) -> List[str]:
+        with self._lock:
+            return self._indexes[field].suggest(prefix, limit)
+
+    def most_common(self, field: str, limit: Optional[int] = None) -> List[str]:
+        with self._lock:
+            return self._indexes[field].most_common(limit)
+
+    def sizes(self) -> Dict[str, int]:
+        with self._lock:
+            return {field: len(index) for field, index in self._indexes.items()}
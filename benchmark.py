@@ -0,0 +1,313 @@
+"""Benchmark DatabaseManager and utils across synthetic dataset sizes.
+
+Usage:
+    python benchmark.py --sizes 10000 100000 --output report.json
+    python benchmark.py --sizes 10000 --compare previous.json
+"""
+import argparse
+import json
+import platform
+import sqlite3
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, Tuple
+import pandas as pd
+from database import DatabaseManager, get_pool
+from models import ApplicationFilters, JobApplication
+from synthetic_data import generate_applications, populate
+from utils import (
+    create_status_chart,
+    create_timeline_chart,
+    create_company_chart,
+    create_salary_chart,
+    create_funnel_chart,
+    choose_timeline_bucket,
+    filter_dataframe,
+    export_to_csv,
+    export_csv_stream,
+    calculate_metrics,
+    clear_figure_cache
+)
+from config import APPLICATIONS_PAGE_SIZE
+
+WRITE_THREADS = 8
+WRITES_PER_THREAD = 50
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# Filters resembling a typical dashboard view: last 90 days of the dataset
+SAMPLE_FILTERS = ApplicationFilters(
+    search='engineer',
+    statuses=['Applied', 'Rejected', 'Technical Interview'],
+    date_from='2025-10-01',
+    date_to='2025-12-31'
+)
+
+SALARY_FILTERS = ApplicationFilters(salary_currency='USD', salary_min=120_000, salary_max=180_000)
+
+def _rows(result) -> int:
+    try:
+        return len(result)
+    except TypeError:
+        return 0
+
+def time_case(func: Callable, repeat: int) -> dict:
+    """Run func `repeat` times and summarize the wall times in milliseconds."""
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return {
+        'min_ms': min(timings),
+        'median_ms': statistics.median(timings),
+        'mean_ms': statistics.fmean(timings),
+        'max_ms': max(timings),
+        'rows': _rows(result)
+    }
+
+def database_cases(db: DatabaseManager) -> List[Tuple[str, Callable]]:
+    """Every public DatabaseManager operation with representative arguments."""
+    filters = SAMPLE_FILTERS
+    sample_id = int(db.get_applications_page(ApplicationFilters(), 1)[0]['id'].iloc[0])
+    sample_ids = list(range(sample_id, max(sample_id - 200, 0), -1))
+    page_cursor = db.get_applications_page(filters, APPLICATIONS_PAGE_SIZE)[1]
+    added_ids = []
+
+    def add():
+        application_id = db.add_application(JobApplication(
+            None, 'Benchmark Engineer', 'Benchmark Inc', 'Remote', '2025-12-31', 'Applied'
+        ))
+        added_ids.append(application_id)
+        return application_id
+
+    def update():
+        application = db.get_application(sample_id)
+        return db.update_application(application.id, application)
+
+    def delete():
+        return db.delete_application(added_ids.pop()) if added_ids else False
+
+    def iterate():
+        return sum(len(rows) for _, rows in db.iter_applications(filters))
+
+    return [
+        ('DatabaseManager.add_application', add),
+        ('DatabaseManager.update_application', update),
+        ('DatabaseManager.delete_application', delete),
+        ('DatabaseManager.get_all_applications', db.get_all_applications),
+        ('DatabaseManager.get_applications_df', db.get_applications_df),
+        ('DatabaseManager.get_application_summaries', lambda: db.get_application_summaries(filters)),
+        ('DatabaseManager.get_application', lambda: db.get_application(sample_id)),
+        ('DatabaseManager.get_applications', lambda: db.get_applications(sample_ids)),
+        ('DatabaseManager.query_applications', lambda: db.query_applications(
+            filters.search, filters.statuses, filters.date_from, filters.date_to)),
+        ('DatabaseManager.get_applications_page', lambda: db.get_applications_page(
+            filters, APPLICATIONS_PAGE_SIZE)[0]),
+        ('DatabaseManager.get_applications_page[next]', lambda: db.get_applications_page(
+            filters, APPLICATIONS_PAGE_SIZE, page_cursor)[0]),
+        ('DatabaseManager.iter_applications', iterate),
+        ('DatabaseManager.search_applications', lambda: db.search_applications('senior data')),
+        ('DatabaseManager.get_status_counts', db.get_status_counts),
+        ('DatabaseManager.get_metrics', lambda: db.get_metrics(filters)),
+        ('DatabaseManager.get_metrics[unfiltered]', db.get_metrics),
+        ('DatabaseManager.get_date_span', db.get_date_span),
+        ('DatabaseManager.get_timeline_counts[day]', lambda: db.get_timeline_counts(filters, 'day')),
+        ('DatabaseManager.get_timeline_counts[month]', lambda: db.get_timeline_counts(
+            ApplicationFilters(), 'month')),
+        ('DatabaseManager.get_company_counts', lambda: db.get_company_counts(filters)),
+        ('DatabaseManager.get_company_counts[unfiltered]', db.get_company_counts),
+        ('DatabaseManager.get_salary_currencies', db.get_salary_currencies),
+        ('DatabaseManager.get_salary_histogram', lambda: db.get_salary_histogram(filters, 'USD')),
+        ('DatabaseManager.get_salary_histogram[range]', lambda: db.get_salary_histogram(SALARY_FILTERS)),
+        ('DatabaseManager.get_status_history', lambda: db.get_status_history(sample_id)),
+        ('DatabaseManager.get_funnel', lambda: db.get_funnel(filters)),
+        ('DatabaseManager.get_funnel[unfiltered]', db.get_funnel),
+        ('DatabaseManager.get_time_in_stage', lambda: db.get_time_in_stage(filters)),
+        ('DatabaseManager.get_time_in_stage[unfiltered]', db.get_time_in_stage),
+        ('DatabaseManager.find_duplicates', lambda: db.find_duplicates(db.get_application(sample_id))),
+        ('DatabaseManager.get_duplicate_report', db.get_duplicate_report),
+        ('DatabaseManager.get_suggestions', lambda: db.get_suggestions('job_title', 'eng')),
+    ]
+
+def utils_cases(db: DatabaseManager) -> List[Tuple[str, Callable]]:
+    """Every utils function, fed with data loaded the way the dashboard loads it."""
+    df = db.get_applications_df()
+    date_range = (SAMPLE_FILTERS.date_from, SAMPLE_FILTERS.date_to)
+    status_counts = db.get_status_counts()
+    timeline = db.get_timeline_counts(ApplicationFilters(), 'day')
+    company_counts = db.get_company_counts()
+    salary_histogram = db.get_salary_histogram(currency='USD')
+    funnel = db.get_funnel()
+    time_in_stage = db.get_time_in_stage()
+
+    def stream_export():
+        with export_csv_stream(db) as export_file:
+            return export_file.seek(0, 2)
+
+    return [
+        ('utils.filter_dataframe', lambda: filter_dataframe(
+            df, SAMPLE_FILTERS.search, SAMPLE_FILTERS.statuses, date_range)),
+        ('utils.calculate_metrics', lambda: calculate_metrics(df)),
+        ('utils.choose_timeline_bucket', lambda: choose_timeline_bucket(*db.get_date_span())),
+        ('utils.create_status_chart', lambda: create_status_chart(status_counts)),
+        ('utils.create_timeline_chart', lambda: create_timeline_chart(timeline, 'day')),
+        ('utils.create_company_chart', lambda: create_company_chart(company_counts)),
+        ('utils.create_salary_chart', lambda: create_salary_chart(salary_histogram, 'USD')),
+        ('utils.create_funnel_chart', lambda: create_funnel_chart(funnel, time_in_stage)),
+        ('utils.export_to_csv', lambda: export_to_csv(df)),
+        ('utils.export_csv_stream', stream_export),
+    ]
+
+def dataframe_memory(db: DatabaseManager) -> dict:
+    """Deep memory usage of the typed applications frame versus plain object columns."""
+    typed = db.get_applications_df()
+    with db.pool.connection() as conn:
+        untyped = pd.read_sql_query('SELECT * FROM job_applications', conn)
+    typed_bytes = int(typed.memory_usage(deep=True).sum())
+    untyped_bytes = int(untyped.memory_usage(deep=True).sum())
+    return {
+        'typed_bytes': typed_bytes,
+        'untyped_bytes': untyped_bytes,
+        'typed_bytes_per_row': typed_bytes / len(typed) if len(typed) else 0,
+        'columns': {column: int(usage) for column, usage in typed.memory_usage(deep=True, index=False).items()}
+    }
+
+def write_throughput(db_path: Path, seed: int) -> dict:
+    """Single-row inserts per second from concurrent writers, committed per row or write-behind."""
+    applications = list(generate_applications(WRITE_THREADS * WRITES_PER_THREAD, seed + 1))
+    results = {}
+    for mode, write_behind in (('direct', False), ('write_behind', True)):
+        db = DatabaseManager(db_path, write_behind=write_behind)
+        def worker(offset):
+            # Without the writer each submit commits inline before returning
+            futures = [db.submit_add_application(application) for application in applications[offset::WRITE_THREADS]]
+            for future in futures:
+                future.result()
+        threads = [threading.Thread(target=worker, args=(offset,)) for offset in range(WRITE_THREADS)]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+        results[mode] = {'writes_per_second': len(applications) / elapsed if elapsed > 0 else 0}
+        if db.writer is not None:
+            results[mode].update(db.writer.stats())
+            db.writer.close()
+    return results
+
+def run_size(size: int, workdir: Path, repeat: int, seed: int) -> dict:
+    """Populate a fresh database with `size` rows and time every case against it."""
+    db_path = workdir / f"benchmark_{size}.db"
+    archive_path = workdir / f"benchmark_{size}_archive.db"
+    for path in (db_path, archive_path):
+        for suffix in ('', '-wal', '-shm'):
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+    db = DatabaseManager(db_path)
+    start = time.perf_counter()
+    populate(db, size, seed)
+    populate_seconds = time.perf_counter() - start
+
+    results = {
+        'populate_seconds': populate_seconds,
+        'populate_rows_per_second': size / populate_seconds if populate_seconds > 0 else 0,
+        'database_bytes': db_path.stat().st_size,
+        'dataframe_memory': dataframe_memory(db),
+        'cases': {}
+    }
+    memory = results['dataframe_memory']
+    print(f"  DataFrame memory: {memory['typed_bytes'] / 2**20:.1f} MiB typed, "
+          f"{memory['untyped_bytes'] / 2**20:.1f} MiB as objects", file=sys.stderr)
+
+    for name, func in database_cases(db) + utils_cases(db):
+        # Measure the query or chart build itself rather than the result cache,
+        # identity map or figure cache
+        def uncached(func=func):
+            db.cache.clear()
+            db.identity_map.clear()
+            clear_figure_cache()
+            return func()
+        results['cases'][name] = time_case(uncached, repeat)
+        print(f"  {name:<55} {results['cases'][name]['median_ms']:>10.2f} ms", file=sys.stderr)
+
+    # Runs last because it adds rows to the database
+    results['write_throughput'] = write_throughput(db_path, seed)
+    for mode, throughput in results['write_throughput'].items():
+        print(f"  {'writes (' + mode + ')':<55} {throughput['writes_per_second']:>10.0f} /s", file=sys.stderr)
+
+    # Then move the closed applications older than a year into the archive tier
+    start = time.perf_counter()
+    moved = db.archive_closed_applications()
+    archive_seconds = time.perf_counter() - start
+    results['archive'] = {
+        'rows_moved': moved,
+        'seconds': archive_seconds,
+        'rows_per_second': moved / archive_seconds if archive_seconds > 0 else 0
+    }
+    print(f"  {'archive_closed_applications':<55} {moved:>10} rows in {archive_seconds:.2f}s", file=sys.stderr)
+
+    get_pool(db_path).close()
+    return results
+
+def compare(report: dict, baseline: dict):
+    """Print median time ratios of this report against a previous one."""
+    for size, results in report['results'].items():
+        previous = baseline.get('results', {}).get(size)
+        if not previous:
+            continue
+        print(f"\n{int(size):,} applications (current / baseline median)")
+        before_memory = previous.get('dataframe_memory')
+        if before_memory and before_memory['typed_bytes'] > 0:
+            ratio = results['dataframe_memory']['typed_bytes'] / before_memory['typed_bytes']
+            print(f"  {'DataFrame memory':<55} {results['dataframe_memory']['typed_bytes'] / 2**20:>7.1f} MiB  x{ratio:.2f}")
+        for name, case in results['cases'].items():
+            before = previous['cases'].get(name)
+            if before and before['median_ms'] > 0:
+                ratio = case['median_ms'] / before['median_ms']
+                print(f"  {name:<55} {case['median_ms']:>10.2f} ms  x{ratio:.2f}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the tracker at several dataset sizes.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help="Dataset sizes")
+    parser.add_argument('--repeat', type=int, default=5, help="Timed runs per case")
+    parser.add_argument('--seed', type=int, default=42, help="Synthetic data seed")
+    parser.add_argument('--workdir', help="Directory for the benchmark databases (default: temp dir)")
+    parser.add_argument('--output', default='benchmark_report.json', help="JSON report path")
+    parser.add_argument('--compare', help="Previous JSON report to compare against")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(args.workdir or tmp)
+        workdir.mkdir(parents=True, exist_ok=True)
+        report = {
+            'generated_at': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'pandas': pd.__version__,
+            'seed': args.seed,
+            'repeat': args.repeat,
+            'results': {}
+        }
+        for size in args.sizes:
+            print(f"Benchmarking {size:,} applications", file=sys.stderr)
+            report['results'][str(size)] = run_size(size, workdir, args.repeat, args.seed)
+
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
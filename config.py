@@ -5,10 +5,70 @@ from pathlib import Path
 DATABASE_PATH = Path("job_applications.db")
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
+# Archive tier: closed applications older than ARCHIVE_AFTER_DAYS are moved to
+# this file (attached as `archive`) and only read when a date filter reaches them
+ARCHIVE_DATABASE_PATH = Path("job_applications_archive.db")
+ARCHIVE_STATUSES = ["Rejected", "Withdrawn", "Accepted"]
+ARCHIVE_AFTER_DAYS = 365
+ARCHIVE_BATCH_SIZE = 1000
+
+# Connection pool configuration
+DATABASE_POOL_SIZE = 8
+DATABASE_TIMEOUT = 30.0
+SQLITE_STATEMENT_CACHE_SIZE = 256
+SQLITE_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -20000,      # negative values are KiB, i.e. ~20 MB page cache
+    "mmap_size": 268435456,    # 256 MB memory-mapped I/O
+    "temp_store": "MEMORY",
+}
+
+# Optional write-behind queue (set TRACKER_WRITE_BEHIND=1): one background thread
+# commits every write that arrives within the window as a single transaction
+WRITE_BEHIND_ENABLED = os.environ.get("TRACKER_WRITE_BEHIND") == "1"
+WRITE_BEHIND_WINDOW = 0.005     # seconds to wait for more writes after the first
+WRITE_BEHIND_MAX_BATCH = 256    # writes per transaction at most
+
+# Query result cache shared by all sessions
+QUERY_CACHE_SIZE = 128
+IDENTITY_MAP_SIZE = 256  # complete records kept per session for the Edit flow
+FIGURE_CACHE_SIZE = 64   # plotly figures shared by all sessions, keyed by input fingerprint
+
+# Company, title and location suggestions from the in-memory prefix index
+AUTOCOMPLETE_LIMIT = 8           # suggestions per lookup
+AUTOCOMPLETE_FORM_OPTIONS = 500  # most used values offered in the form's dropdowns
+
+# Bulk import configuration
+IMPORT_BATCH_SIZE = 1000
+
+# Export configuration
+EXPORT_CHUNK_SIZE = 5000
+EXPORT_SPOOL_MAX_SIZE = 8 * 1024 * 1024  # spill to disk beyond 8 MB
+
+# Columnar snapshots for analytics (requires pyarrow)
+SNAPSHOT_DIR = Path("snapshots")
+SNAPSHOT_MAX_PARTS = 16  # incremental parts kept before they are compacted into one
+
+# Rerun timing metrics (set TRACKER_METRICS=1 to write the log and textfile)
+METRICS_ENABLED = os.environ.get("TRACKER_METRICS") == "1"
+METRICS_LOG_PATH = Path(os.environ.get("TRACKER_METRICS_LOG", "metrics/reruns.jsonl"))
+METRICS_LOG_MAX_BYTES = 5 * 1024 * 1024
+METRICS_LOG_BACKUPS = 3
+METRICS_PROM_PATH = Path(os.environ.get("TRACKER_METRICS_PROM", "metrics/tracker.prom"))
+METRICS_WINDOW = 500  # reruns kept for p50/p95 summaries
+
 # Streamlit configuration
 PAGE_TITLE = "Matha-e-Nosto"
 PAGE_ICON = "🎯"
 LAYOUT = "wide"
+APPLICATIONS_PAGE_SIZE = 25
+LOADER_WORKERS = 4  # threads shared by all sessions for loading data and building charts
+
+# Timeline chart configuration
+TIMELINE_DAILY_MAX_DAYS = 120     # longer spans are bucketed by week
+TIMELINE_WEEKLY_MAX_DAYS = 730    # longer spans are bucketed by month
+TIMELINE_WEBGL_THRESHOLD = 500    # render with WebGL beyond this many points
 
 # Status options
 STATUS_OPTIONS = [
@@ -24,6 +84,21 @@ STATUS_OPTIONS = [
     "Follow-up"
 ]
 
+# Statuses used to derive the dashboard rates
+NO_RESPONSE_STATUSES = ["Applied", "Follow-up"]
+OFFER_STATUSES = ["Offered", "Accepted"]
+
+# Ordered hiring pipeline for the funnel; the other statuses are exits or side steps
+PIPELINE_STAGES = [
+    "Applied",
+    "Phone Screen",
+    "Technical Interview",
+    "Onsite Interview",
+    "Final Interview",
+    "Offered",
+    "Accepted"
+]
+
 # Status colors for visualization
 STATUS_COLORS = {
     "Applied": "#3b82f6",
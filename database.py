@@ -1,66 +1,1004 @@
+import functools
+import queue
+import re
 import sqlite3
+import threading
+import time
 import pandas as pd
-from datetime import datetime
-from typing import List, Optional
-from models import JobApplication
-from config import DATABASE_PATH
+from collections import deque
+from concurrent.futures import Future
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from cache import LRUCache
+from instrumentation import TracedConnection, annotate, traced
+from salary import parse_salary
+from dedup import dedup_keys
+from autocomplete import AutocompleteIndex, AUTOCOMPLETE_FIELDS
+from models import (
+    ApplicationFilters,
+    ApplicationSummary,
+    JobApplication,
+    SUMMARY_FIELDS,
+    summarize_status_counts
+)
+from config import (
+    DATABASE_PATH,
+    DATABASE_POOL_SIZE,
+    DATABASE_TIMEOUT,
+    SQLITE_STATEMENT_CACHE_SIZE,
+    SQLITE_PRAGMAS,
+    IMPORT_BATCH_SIZE,
+    EXPORT_CHUNK_SIZE,
+    QUERY_CACHE_SIZE,
+    IDENTITY_MAP_SIZE,
+    AUTOCOMPLETE_LIMIT,
+    ARCHIVE_DATABASE_PATH,
+    ARCHIVE_STATUSES,
+    ARCHIVE_AFTER_DAYS,
+    ARCHIVE_BATCH_SIZE,
+    STATUS_OPTIONS,
+    PIPELINE_STAGES,
+    WRITE_BEHIND_ENABLED,
+    WRITE_BEHIND_WINDOW,
+    WRITE_BEHIND_MAX_BATCH,
+    METRICS_WINDOW
+)
+
+# Columns needed to list applications; job_description and notes are loaded on demand
+SUMMARY_COLUMNS = ', '.join(SUMMARY_FIELDS)
+APPLICATION_COLUMNS = ', '.join(field.name for field in fields(JobApplication))
+
+# Dtypes of application DataFrames, applied once when a frame is loaded
+DATETIME_COLUMNS = ('application_date', 'created_at', 'updated_at')
+CATEGORY_COLUMNS = ('status', 'company_name', 'location')
+STATUS_DTYPE = pd.CategoricalDtype(STATUS_OPTIONS)
+
+# Derived from salary_range whenever a row is written
+SALARY_COLUMNS = {
+    'salary_min': 'REAL',
+    'salary_max': 'REAL',
+    'salary_currency': 'TEXT',
+}
+
+# Normalized company, title and location, derived whenever a row is written
+DEDUP_COLUMNS = {
+    'company_key': 'TEXT',
+    'title_key': 'TEXT',
+    'location_key': 'TEXT',
+    'dedup_hash': 'TEXT',
+}
+
+# Every column of the table, in a fixed order shared by the hot and archive tiers
+STORED_COLUMNS = ', '.join(
+    [field.name for field in fields(JobApplication)] + list(SALARY_COLUMNS) + list(DEDUP_COLUMNS)
+)
+
+APPLICATIONS_TABLE_SQL = '''
+    CREATE TABLE IF NOT EXISTS {schema}.job_applications (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_title TEXT NOT NULL,
+        company_name TEXT NOT NULL,
+        location TEXT NOT NULL,
+        application_date DATE NOT NULL,
+        status TEXT NOT NULL,
+        salary_range TEXT,
+        job_description TEXT,
+        notes TEXT,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        salary_min REAL,
+        salary_max REAL,
+        salary_currency TEXT,
+        company_key TEXT,
+        title_key TEXT,
+        location_key TEXT,
+        dedup_hash TEXT
+    )
+'''
+
+# Indexes on the archive tier: (name suffix, columns)
+ARCHIVE_INDEXES = (
+    ('application_date', 'application_date, id'),
+    ('status', 'status, application_date'),
+    ('dedup_hash', 'dedup_hash'),
+    ('updated_at', 'updated_at'),
+)
+
+INSERT_APPLICATION_SQL = '''
+    INSERT INTO job_applications 
+    (job_title, company_name, location, application_date, status, 
+     salary_range, job_description, notes,
+     salary_min, salary_max, salary_currency,
+     company_key, title_key, location_key, dedup_hash)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+def _insert_params(application: JobApplication) -> tuple:
+    return (
+        application.job_title,
+        application.company_name,
+        application.location,
+        application.application_date,
+        application.status,
+        application.salary_range,
+        application.job_description,
+        application.notes,
+        *parse_salary(application.salary_range),
+        *dedup_keys(application.company_name, application.job_title, application.location)
+    )
+
+UPDATE_APPLICATION_SQL = '''
+    UPDATE job_applications 
+    SET job_title=?, company_name=?, location=?, application_date=?, 
+        status=?, salary_range=?, job_description=?, notes=?,
+        salary_min=?, salary_max=?, salary_currency=?,
+        company_key=?, title_key=?, location_key=?, dedup_hash=?,
+        updated_at=CURRENT_TIMESTAMP
+    WHERE id=?
+'''
+
+# Single-row writes, run either directly or on the write-behind thread; the caller commits
+def _insert(conn: sqlite3.Connection, application: JobApplication) -> int:
+    return conn.execute(INSERT_APPLICATION_SQL, _insert_params(application)).lastrowid
+
+def _update(conn: sqlite3.Connection, application_id: int, application: JobApplication) -> bool:
+    return conn.execute(UPDATE_APPLICATION_SQL, (*_insert_params(application), application_id)).rowcount > 0
+
+def _delete(conn: sqlite3.Connection, application_id: int) -> bool:
+    if conn.execute('DELETE FROM main.job_applications WHERE id=?', (application_id,)).rowcount > 0:
+        return True
+    # Archived applications are read-only but can still be deleted
+    return conn.execute('DELETE FROM archive.job_applications WHERE id=?', (application_id,)).rowcount > 0
+
+def _autocomplete_values(application: JobApplication) -> tuple:
+    return tuple(getattr(application, field) for field in AUTOCOMPLETE_FIELDS)
+
+def _stored_autocomplete_values(conn: sqlite3.Connection, application_id: int) -> List[tuple]:
+    return conn.execute(
+        f"SELECT {', '.join(AUTOCOMPLETE_FIELDS)} FROM job_applications WHERE id=?", (application_id,)
+    ).fetchall()
+
+def _typed_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse date columns to datetime64 and store repeated strings as categories."""
+    for column in DATETIME_COLUMNS:
+        if column in df:
+            df[column] = pd.to_datetime(df[column], format='ISO8601', errors='coerce')
+    for column in CATEGORY_COLUMNS:
+        if column in df:
+            df[column] = df[column].astype(STATUS_DTYPE if column == 'status' else 'category')
+    return df
+
+class ConnectionPool:
+    """Thread-safe pool of SQLite connections for a single database file.
+
+    Each connection is handed to one thread at a time and returned to the pool
+    afterwards, so the pragma setup and the per-connection prepared statement
+    cache survive across Streamlit reruns and sessions.
+    """
+
+    def __init__(self, db_path, max_size: int = DATABASE_POOL_SIZE, archive_path=None):
+        self.db_path = db_path
+        self.archive_path = archive_path
+        self.max_size = max_size
+        self._idle = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._watcher = None
+        self._watcher_lock = threading.Lock()
+    
+    def _create_connection(self, factory=TracedConnection) -> sqlite3.Connection:
+        """Open a new connection and apply the tuned pragmas."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=DATABASE_TIMEOUT,
+            check_same_thread=False,
+            cached_statements=SQLITE_STATEMENT_CACHE_SIZE,
+            factory=factory
+        )
+        for pragma, value in SQLITE_PRAGMAS.items():
+            conn.execute(f"PRAGMA {pragma}={value}")
+        if self.archive_path is not None:
+            # Every connection sees the archive tier as the `archive` schema
+            conn.execute('ATTACH DATABASE ? AS archive', (str(self.archive_path),))
+            for pragma in ('journal_mode', 'synchronous'):
+                conn.execute(f"PRAGMA archive.{pragma}={SQLITE_PRAGMAS[pragma]}")
+        return conn
+    
+    def acquire(self) -> sqlite3.Connection:
+        """Borrow a connection, opening a new one while under the size limit."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._lock:
+            can_create = self._created < self.max_size
+            if can_create:
+                self._created += 1
+        
+        if can_create:
+            try:
+                return self._create_connection()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        
+        try:
+            return self._idle.get(timeout=DATABASE_TIMEOUT)
+        except queue.Empty:
+            raise sqlite3.OperationalError("Timed out waiting for a pooled database connection")
+    
+    def release(self, conn: sqlite3.Connection):
+        """Return a connection to the pool, discarding any unfinished transaction."""
+        if conn.in_transaction:
+            conn.rollback()
+        self._idle.put(conn)
+    
+    @contextmanager
+    def connection(self):
+        """Context manager that borrows a connection and always returns it."""
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+    
+    def data_version(self) -> int:
+        """Get a number that changes whenever any connection commits a write.
+        
+        PRAGMA data_version only reports commits made by *other* connections,
+        so it is read from a dedicated watcher connection that never writes.
+        That way it sees writes from every pooled connection as well as from
+        other processes such as the bulk importer. The archive's counter is
+        added in, so changes to either tier produce a new number.
+        """
+        with self._watcher_lock:
+            if self._watcher is None:
+                self._watcher = self._create_connection(factory=sqlite3.Connection)
+            version = self._watcher.execute('PRAGMA data_version').fetchone()[0]
+            if self.archive_path is not None:
+                version += self._watcher.execute('PRAGMA archive.data_version').fetchone()[0]
+            return version
+    
+    def close(self):
+        """Close every idle connection held by the pool."""
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            conn.close()
+            with self._lock:
+                self._created -= 1
+
+# Queued by WriteBehindQueue.flush in place of an operation
+_FLUSH = object()
+
+class WriteBehindQueue:
+    """Single background writer that commits queued writes in shared transactions.
+    
+    Writes submitted within WRITE_BEHIND_WINDOW of the first one in a batch
+    are applied on one connection inside one BEGIN IMMEDIATE transaction, each
+    in its own SAVEPOINT so a failing write is rolled back alone. Futures are
+    resolved only after the commit, so a caller that waits on one can read
+    its own write.
+    """
+    
+    def __init__(self, pool: ConnectionPool, window: float = WRITE_BEHIND_WINDOW,
+                 max_batch: int = WRITE_BEHIND_MAX_BATCH):
+        self.pool = pool
+        self.window = window
+        self.max_batch = max_batch
+        self._queue = queue.Queue()
+        self._stats_lock = threading.Lock()
+        self._batch_sizes = deque(maxlen=METRICS_WINDOW)
+        self._latencies_ms = deque(maxlen=METRICS_WINDOW)
+        self.batches = 0
+        self.operations = 0
+        self.failures = 0
+        self._thread = threading.Thread(target=self._run, name='write-behind', daemon=True)
+        self._thread.start()
+    
+    def submit(self, operation: Callable[[sqlite3.Connection], object]) -> Future:
+        """Queue a write; the future resolves to its return value once committed."""
+        if not self._thread.is_alive():
+            raise RuntimeError("The write-behind queue has been closed")
+        future = Future()
+        self._queue.put((operation, future, time.perf_counter()))
+        return future
+    
+    def flush(self, timeout: Optional[float] = None):
+        """Block until every write submitted so far has been committed."""
+        if not self._thread.is_alive():
+            return
+        # A marker rather than a no-op write, so it isn't counted in the stats
+        future = Future()
+        self._queue.put((_FLUSH, future, time.perf_counter()))
+        future.result(timeout)
+    
+    def close(self):
+        """Commit the pending writes, stop the writer thread and unregister it."""
+        if self._thread.is_alive():
+            self._queue.put(None)
+            self._thread.join()
+        with _pools_lock:
+            key = str(self.pool.db_path)
+            if _writers.get(key) is self:
+                del _writers[key]
+    
+    def _next_batch(self) -> Optional[list]:
+        item = self._queue.get()
+        if item is None:
+            return None
+        batch = [item]
+        deadline = time.perf_counter() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Finish this batch, then stop
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+    
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._commit(batch)
+    
+    def _commit(self, batch: list):
+        flushes = [future for operation, future, _ in batch if operation is _FLUSH]
+        batch = [item for item in batch if item[0] is not _FLUSH]
+        if batch:
+            self._apply(batch)
+        # Everything queued before a flush marker has now been committed
+        for future in flushes:
+            future.set_result(None)
+    
+    def _apply(self, batch: list):
+        results = []
+        try:
+            with self.pool.connection() as conn:
+                conn.execute('BEGIN IMMEDIATE')
+                for operation, future, _ in batch:
+                    conn.execute('SAVEPOINT write_behind')
+                    try:
+                        results.append((future, operation(conn), None))
+                        conn.execute('RELEASE write_behind')
+                    except Exception as e:
+                        conn.execute('ROLLBACK TO write_behind')
+                        conn.execute('RELEASE write_behind')
+                        results.append((future, None, e))
+                conn.commit()
+        except Exception as e:
+            # The transaction itself failed, so none of the writes were applied
+            results = [(future, None, e) for _, future, _ in batch]
+        
+        committed = time.perf_counter()
+        with self._stats_lock:
+            self.batches += 1
+            self.operations += len(batch)
+            self.failures += sum(1 for _, _, error in results if error is not None)
+            self._batch_sizes.append(len(batch))
+            self._latencies_ms.extend((committed - queued) * 1000 for _, _, queued in batch)
+        
+        for future, result, error in results:
+            if error is None:
+                future.set_result(result)
+            else:
+                future.set_exception(error)
+    
+    def stats(self) -> dict:
+        """Get batch size and queue latency (submit to commit) over recent batches."""
+        with self._stats_lock:
+            sizes = sorted(self._batch_sizes)
+            latencies = sorted(self._latencies_ms)
+            summary = {
+                'batches': self.batches,
+                'operations': self.operations,
+                'failures': self.failures,
+                'pending': self._queue.qsize()
+            }
+        summary['batch_size_mean'] = sum(sizes) / len(sizes) if sizes else 0
+        summary['batch_size_max'] = sizes[-1] if sizes else 0
+        summary['latency_p50_ms'] = latencies[len(latencies) // 2] if latencies else 0
+        summary['latency_p95_ms'] = latencies[int(len(latencies) * 0.95)] if latencies else 0
+        return summary
+
+def build_fts_query(text: str) -> Optional[str]:
+    """Turn free-form search text into a prefix-aware FTS5 MATCH expression."""
+    tokens = re.findall(r'\w+', text or '')
+    if not tokens:
+        return None
+    return ' '.join(f'"{token}"*' for token in tokens)
+
+# Summary tables maintained by triggers: (table, job_applications column)
+AGGREGATE_TABLES = (
+    ('status_counts', 'status'),
+    ('daily_counts', 'application_date'),
+    ('company_counts', 'company_name'),
+)
+
+# SQL expressions that map application_date onto a timeline bucket
+TIMELINE_BUCKET_SQL = {
+    'day': 'application_date',
+    'week': "date(application_date, 'weekday 0', '-6 days')",
+    'month': "strftime('%Y-%m-01', application_date)",
+}
+
+# Position of a status in the pipeline; exits and side steps rank with the first stage
+STAGE_RANK_SQL = 'CASE status ' + ' '.join('WHEN ? THEN ?' for _ in PIPELINE_STAGES) + ' ELSE 0 END'
+STAGE_RANK_PARAMS = [value for rank, stage in enumerate(PIPELINE_STAGES) for value in (stage, rank)]
+
+# Maximum number of ids bound into a single IN (...) lookup
+LOOKUP_BATCH_SIZE = 500
+
+_MISSING = object()
+
+def _freeze(value):
+    """Convert query arguments into a hashable cache key."""
+    if is_dataclass(value):
+        return (type(value).__name__,) + tuple(_freeze(getattr(value, f.name)) for f in fields(value))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+def cached_read(method):
+    """Serve a DatabaseManager read from the shared cache until the data changes.
+    
+    Cached results are shared between sessions and must not be mutated.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        version = self.pool.data_version()
+        self.cache.sync_version(version)
+        key = (method.__name__, _freeze(args), _freeze(kwargs))
+        result = self.cache.get(key, _MISSING)
+        annotate(cache='miss' if result is _MISSING else 'hit')
+        if result is _MISSING:
+            result = method(self, *args, **kwargs)
+            # Don't cache a result that may predate a concurrent write
+            if self.pool.data_version() == version:
+                self.cache.put(key, result)
+        return result
+    return wrapper
+
+_pools: Dict[str, ConnectionPool] = {}
+_caches: Dict[str, LRUCache] = {}
+_writers: Dict[str, WriteBehindQueue] = {}
+_autocompletes: Dict[str, AutocompleteIndex] = {}
+_pools_lock = threading.Lock()
+
+def get_pool(db_path, archive_path=None) -> ConnectionPool:
+    """Return the process-wide connection pool for a database file."""
+    key = str(db_path)
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = ConnectionPool(db_path, archive_path=archive_path)
+        return pool
+
+def archive_path_for(db_path) -> Path:
+    """Get the archive file that goes with a database file, e.g. tracker.db -> tracker_archive.db."""
+    if db_path is None or Path(db_path) == DATABASE_PATH:
+        return ARCHIVE_DATABASE_PATH
+    db_path = Path(db_path)
+    return db_path.with_name(f"{db_path.stem}_archive{db_path.suffix}")
+
+def get_cache(db_path) -> LRUCache:
+    """Return the process-wide query result cache for a database file."""
+    key = str(db_path)
+    with _pools_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = LRUCache(QUERY_CACHE_SIZE)
+        return cache
+
+def get_autocomplete(db_path) -> AutocompleteIndex:
+    """Return the process-wide autocomplete index for a database file."""
+    key = str(db_path)
+    with _pools_lock:
+        index = _autocompletes.get(key)
+        if index is None:
+            index = _autocompletes[key] = AutocompleteIndex()
+        return index
+
+def get_writer(db_path) -> WriteBehindQueue:
+    """Return the process-wide write-behind queue for a database file."""
+    key = str(db_path)
+    pool = get_pool(db_path)
+    with _pools_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = WriteBehindQueue(pool)
+        return writer
 
 class DatabaseManager:
-    def __init__(self):
-        self.db_path = DATABASE_PATH
+    def __init__(self, db_path=None, write_behind: Optional[bool] = None, archive_path=None):
+        self.db_path = db_path or DATABASE_PATH
+        self.archive_path = archive_path or archive_path_for(db_path)
+        self.pool = get_pool(self.db_path, self.archive_path)
+        self.cache = get_cache(self.db_path)
+        # Writes go through the shared background writer when enabled
+        if write_behind is None:
+            write_behind = WRITE_BEHIND_ENABLED
+        self.writer = get_writer(self.db_path) if write_behind else None
+        # Records loaded by this session, keyed by id and reset when the data changes
+        self.identity_map = LRUCache(IDENTITY_MAP_SIZE)
+        self.autocomplete = get_autocomplete(self.db_path)
+        self.fts_enabled = False
         self.init_database()
     
     def init_database(self):
         """Initialize the database and create tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.pool.connection() as conn:
             cursor = conn.cursor()
+            cursor.execute(APPLICATIONS_TABLE_SQL.format(schema='main'))
             cursor.execute('''
-                CREATE TABLE IF NOT EXISTS job_applications (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    job_title TEXT NOT NULL,
-                    company_name TEXT NOT NULL,
-                    location TEXT NOT NULL,
-                    application_date DATE NOT NULL,
-                    status TEXT NOT NULL,
-                    salary_range TEXT,
-                    job_description TEXT,
-                    notes TEXT,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
+                CREATE INDEX IF NOT EXISTS idx_job_applications_application_date
+                ON job_applications (application_date)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_job_applications_status
+                ON job_applications (status, application_date)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_job_applications_company_name
+                ON job_applications (company_name)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_job_applications_updated_at
+                ON job_applications (updated_at)
             ''')
             conn.commit()
+            self._init_salary_columns(conn)
+            self._init_dedup_columns(conn)
+            self._init_aggregates(conn)
+            self._init_status_events(conn)
+            self.fts_enabled = self._init_fts(conn)
+            self._init_archive(conn)
+            cursor.execute('PRAGMA optimize')
+    
+    def _add_columns(self, conn: sqlite3.Connection, columns: Dict[str, str]) -> List[str]:
+        """Add any of `columns` (name -> type) missing from older databases; returns those added."""
+        existing = {row[1] for row in conn.execute('PRAGMA table_info(job_applications)')}
+        missing = [column for column in columns if column not in existing]
+        for column in missing:
+            conn.execute(f'ALTER TABLE job_applications ADD COLUMN {column} {columns[column]}')
+        return missing
+    
+    def _init_salary_columns(self, conn: sqlite3.Connection):
+        """Add the parsed salary columns to older databases and fill them in."""
+        missing = self._add_columns(conn, SALARY_COLUMNS)
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_job_applications_salary
+            ON job_applications (salary_currency, salary_min, salary_max)
+        ''')
+        conn.commit()
+        
+        if missing:
+            self.backfill_salaries(conn)
+    
+    def _init_dedup_columns(self, conn: sqlite3.Connection):
+        """Add the normalized duplicate-detection keys to older databases and fill them in."""
+        missing = self._add_columns(conn, DEDUP_COLUMNS)
+        conn.execute('''
+            CREATE INDEX IF NOT EXISTS idx_job_applications_dedup_hash
+            ON job_applications (dedup_hash)
+        ''')
+        conn.commit()
+        
+        if missing:
+            self.backfill_dedup_keys(conn)
+    
+    def _backfill(self, conn: sqlite3.Connection, source_columns: List[str],
+                  target_columns: List[str], compute, condition: str = '1',
+                  batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """Recompute derived columns in id order, one transaction per batch.
+        
+        `compute` maps a row of source column values to a tuple of target
+        values. Batches are keyset-paginated on id so each is an index seek
+        and writers are only blocked for one batch at a time.
+        """
+        assignments = ', '.join(f'{column}=?' for column in target_columns)
+        updated = 0
+        last_id = 0
+        while True:
+            rows = conn.execute(f'''
+                SELECT id, {', '.join(source_columns)} FROM job_applications
+                WHERE id > ? AND ({condition})
+                ORDER BY id
+                LIMIT ?
+            ''', (last_id, batch_size)).fetchall()
+            if not rows:
+                break
+            conn.executemany(
+                f'UPDATE job_applications SET {assignments} WHERE id=?',
+                [(*compute(*row[1:]), row[0]) for row in rows]
+            )
+            conn.commit()
+            updated += len(rows)
+            last_id = rows[-1][0]
+        return updated
+    
+    def backfill_salaries(self, conn: Optional[sqlite3.Connection] = None,
+                          batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """Re-parse salary_range into the numeric salary columns for every row."""
+        if conn is None:
+            with self.pool.connection() as conn:
+                return self.backfill_salaries(conn, batch_size)
+        
+        return self._backfill(
+            conn, ['salary_range'], list(SALARY_COLUMNS), parse_salary,
+            condition='salary_range IS NOT NULL', batch_size=batch_size
+        )
+    
+    def backfill_dedup_keys(self, conn: Optional[sqlite3.Connection] = None,
+                            batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """Recompute the normalized keys and dedup hash for every row."""
+        if conn is None:
+            with self.pool.connection() as conn:
+                return self.backfill_dedup_keys(conn, batch_size)
+        
+        return self._backfill(
+            conn, ['company_name', 'job_title', 'location'], list(DEDUP_COLUMNS), dedup_keys,
+            batch_size=batch_size
+        )
+    
+    def _init_aggregates(self, conn: sqlite3.Connection):
+        """Create the summary count tables and the triggers that maintain them."""
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name IN (%s)"
+            % ', '.join(f"'{table}'" for table, _ in AGGREGATE_TABLES)
+        )
+        exists = cursor.fetchone()[0] == len(AGGREGATE_TABLES)
+        
+        for table, column in AGGREGATE_TABLES:
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {table} (
+                    {column} TEXT PRIMARY KEY,
+                    count INTEGER NOT NULL
+                ) WITHOUT ROWID
+            ''')
+            increment = f'''
+                INSERT INTO {table} ({column}, count) VALUES (new.{column}, 1)
+                ON CONFLICT ({column}) DO UPDATE SET count = count + 1;
+            '''
+            decrement = f'''
+                UPDATE {table} SET count = count - 1 WHERE {column} = old.{column};
+                DELETE FROM {table} WHERE {column} = old.{column} AND count <= 0;
+            '''
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_insert
+                AFTER INSERT ON job_applications BEGIN {increment} END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_delete
+                AFTER DELETE ON job_applications BEGIN {decrement} END
+            ''')
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS {table}_update
+                AFTER UPDATE OF {column} ON job_applications
+                WHEN old.{column} IS NOT new.{column}
+                BEGIN {decrement} {increment} END
+            ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_company_counts_count
+            ON company_counts (count DESC)
+        ''')
+        conn.commit()
+        
+        if not exists:
+            self.rebuild_aggregates(conn)
+    
+    def rebuild_aggregates(self, conn: Optional[sqlite3.Connection] = None):
+        """Recompute every summary table from job_applications."""
+        if conn is None:
+            with self.pool.connection() as conn:
+                return self.rebuild_aggregates(conn)
+        
+        for table, column in AGGREGATE_TABLES:
+            conn.execute(f'DELETE FROM {table}')
+            conn.execute(f'''
+                INSERT INTO {table} ({column}, count)
+                SELECT {column}, COUNT(*) FROM job_applications GROUP BY {column}
+            ''')
+        conn.commit()
+    
+    def _init_status_events(self, conn: sqlite3.Connection):
+        """Create the append-only status history and the triggers that record it.
+        
+        Events are written by triggers inside the same transaction as the
+        insert or status change, so the history can't drift from the table.
+        """
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='status_events'"
+        )
+        exists = cursor.fetchone() is not None
+        
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS status_events (
+                id INTEGER PRIMARY KEY,
+                application_id INTEGER NOT NULL,
+                status TEXT NOT NULL,
+                changed_at DATETIME NOT NULL
+            )
+        ''')
+        # Covers the per-application window scans in (changed_at, id) order, so
+        # changes made within the same second keep their sequence without a sort
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_status_events_application
+            ON status_events (application_id, changed_at, id, status)
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS status_events_insert
+            AFTER INSERT ON job_applications BEGIN
+                INSERT INTO status_events (application_id, status, changed_at)
+                VALUES (new.id, new.status, new.application_date);
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS status_events_update
+            AFTER UPDATE OF status ON job_applications
+            WHEN old.status IS NOT new.status
+            BEGIN
+                INSERT INTO status_events (application_id, status, changed_at)
+                VALUES (new.id, new.status, CURRENT_TIMESTAMP);
+            END
+        ''')
+        for action in ('UPDATE', 'DELETE'):
+            cursor.execute(f'''
+                CREATE TRIGGER IF NOT EXISTS status_events_no_{action.lower()}
+                BEFORE {action} ON status_events BEGIN
+                    SELECT RAISE(ABORT, 'status_events is append-only');
+                END
+            ''')
+        
+        if not exists:
+            # Earlier history is unknown; start each application at its current status
+            cursor.execute('''
+                INSERT INTO status_events (application_id, status, changed_at)
+                SELECT id, status, application_date FROM job_applications ORDER BY id
+            ''')
+        conn.commit()
+    
+    def _init_fts(self, conn: sqlite3.Connection, schema: str = 'main') -> bool:
+        """Create the FTS5 index and the triggers that keep it in sync."""
+        cursor = conn.cursor()
+        cursor.execute(
+            f"SELECT 1 FROM {schema}.sqlite_master WHERE type='table' AND name='job_applications_fts'"
+        )
+        exists = cursor.fetchone() is not None
+        
+        try:
+            cursor.execute(f'''
+                CREATE VIRTUAL TABLE IF NOT EXISTS {schema}.job_applications_fts USING fts5(
+                    job_title, company_name, location, job_description, notes,
+                    content='job_applications', content_rowid='id',
+                    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+                )
+            ''')
+        except sqlite3.OperationalError:
+            # SQLite was built without FTS5; searches fall back to LIKE scans
+            conn.rollback()
+            return False
+        
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {schema}.job_applications_fts_insert
+            AFTER INSERT ON job_applications BEGIN
+                INSERT INTO job_applications_fts
+                (rowid, job_title, company_name, location, job_description, notes)
+                VALUES (new.id, new.job_title, new.company_name, new.location,
+                        new.job_description, new.notes);
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {schema}.job_applications_fts_delete
+            AFTER DELETE ON job_applications BEGIN
+                INSERT INTO job_applications_fts
+                (job_applications_fts, rowid, job_title, company_name, location,
+                 job_description, notes)
+                VALUES ('delete', old.id, old.job_title, old.company_name, old.location,
+                        old.job_description, old.notes);
+            END
+        ''')
+        cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS {schema}.job_applications_fts_update
+            AFTER UPDATE OF job_title, company_name, location, job_description, notes
+            ON job_applications BEGIN
+                INSERT INTO job_applications_fts
+                (job_applications_fts, rowid, job_title, company_name, location,
+                 job_description, notes)
+                VALUES ('delete', old.id, old.job_title, old.company_name, old.location,
+                        old.job_description, old.notes);
+                INSERT INTO job_applications_fts
+                (rowid, job_title, company_name, location, job_description, notes)
+                VALUES (new.id, new.job_title, new.company_name, new.location,
+                        new.job_description, new.notes);
+            END
+        ''')
+        
+        if not exists:
+            # Index rows that were added before the FTS table existed
+            cursor.execute(f"INSERT INTO {schema}.job_applications_fts(job_applications_fts) VALUES ('rebuild')")
+        conn.commit()
+        return True
+    
+    def _init_archive(self, conn: sqlite3.Connection):
+        """Create the archive tier's table, indexes and full-text index in the attached file.
+        
+        Archived rows keep their ids, and their status_events stay in the hot
+        file since that table is append-only, so history lookups still work.
+        """
+        cursor = conn.cursor()
+        cursor.execute(APPLICATIONS_TABLE_SQL.format(schema='archive'))
+        for name, columns in ARCHIVE_INDEXES:
+            cursor.execute(f'''
+                CREATE INDEX IF NOT EXISTS archive.idx_job_applications_{name}
+                ON job_applications ({columns})
+            ''')
+        conn.commit()
+        if self.fts_enabled:
+            self._init_fts(conn, 'archive')
+    
+    def _submit(self, operation: Callable[[sqlite3.Connection], object]) -> Future:
+        """Queue a write on the background writer, or run and commit it now."""
+        if self.writer is not None:
+            return self.writer.submit(operation)
+        future = Future()
+        try:
+            with self.pool.connection() as conn:
+                result = operation(conn)
+                conn.commit()
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        return future
+    
+    def _track_autocomplete(self, future: Future, removed: List[tuple], added: List[tuple]) -> Future:
+        """Apply a write to the autocomplete index once it has committed and changed a row."""
+        def apply(future):
+            if future.exception() is None and future.result():
+                self.autocomplete.apply(removed, added)
+        future.add_done_callback(apply)
+        return future
     
+    def submit_add_application(self, application: JobApplication) -> Future:
+        """Queue an insert; the future resolves to the new id once committed."""
+        return self._track_autocomplete(
+            self._submit(functools.partial(_insert, application=application)),
+            [], [_autocomplete_values(application)]
+        )
+    
+    def submit_update_application(self, application_id: int, application: JobApplication) -> Future:
+        """Queue an update; the future resolves to whether a row was changed."""
+        previous = []
+        def update(conn):
+            previous.extend(_stored_autocomplete_values(conn, application_id))
+            return _update(conn, application_id, application)
+        return self._track_autocomplete(self._submit(update), previous, [_autocomplete_values(application)])
+    
+    def submit_delete_application(self, application_id: int) -> Future:
+        """Queue a delete; the future resolves to whether a row was removed."""
+        previous = []
+        def delete(conn):
+            previous.extend(_stored_autocomplete_values(conn, application_id))
+            return _delete(conn, application_id)
+        return self._track_autocomplete(self._submit(delete), previous, [])
+    
+    def flush(self, timeout: Optional[float] = None):
+        """Wait until every queued write has been committed."""
+        if self.writer is not None:
+            self.writer.flush(timeout)
+    
+    @traced
     def add_application(self, application: JobApplication) -> int:
         """Add a new job application to the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO job_applications 
-                (job_title, company_name, location, application_date, status, 
-                 salary_range, job_description, notes)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                application.job_title,
-                application.company_name,
-                application.location,
-                application.application_date,
-                application.status,
-                application.salary_range,
-                application.job_description,
-                application.notes
-            ))
-            conn.commit()
-            return cursor.lastrowid
+        return self.submit_add_application(application).result()
+    
+    @traced
+    def bulk_insert(self, applications: Iterable[JobApplication],
+                    batch_size: int = IMPORT_BATCH_SIZE) -> int:
+        """Insert applications with executemany, committing one transaction per batch.
+        
+        The iterable is consumed lazily, so callers can stream rows from a file
+        without holding the whole import in memory. Returns the number of rows
+        inserted.
+        """
+        inserted = 0
+        batch = []
+        added = []
+        with self.pool.connection() as conn:
+            for application in applications:
+                batch.append(_insert_params(application))
+                added.append(_autocomplete_values(application))
+                if len(batch) >= batch_size:
+                    conn.executemany(INSERT_APPLICATION_SQL, batch)
+                    conn.commit()
+                    self.autocomplete.apply(added=added)
+                    inserted += len(batch)
+                    batch = []
+                    added = []
+            if batch:
+                conn.executemany(INSERT_APPLICATION_SQL, batch)
+                conn.commit()
+                self.autocomplete.apply(added=added)
+                inserted += len(batch)
+        return inserted
+    
+    @traced
+    def archive_closed_applications(self, older_than_days: int = ARCHIVE_AFTER_DAYS,
+                                    batch_size: int = ARCHIVE_BATCH_SIZE) -> int:
+        """Move closed applications dated before the cutoff into the archive tier.
+        
+        Each batch is first copied with INSERT OR IGNORE and committed, then
+        deleted from the hot table in a second transaction. Commits across
+        attached WAL files aren't atomic together, so this order means an
+        interrupted run leaves a row in both tiers rather than in neither, and
+        the next run finishes the move. Returns the number of rows moved.
+        """
+        cutoff = (date.today() - timedelta(days=older_than_days)).isoformat()
+        status_placeholders = ', '.join('?' * len(ARCHIVE_STATUSES))
+        moved = 0
+        with self.pool.connection() as conn:
+            while True:
+                ids = [row[0] for row in conn.execute(f'''
+                    SELECT id FROM main.job_applications
+                    WHERE status IN ({status_placeholders}) AND application_date < ?
+                    LIMIT ?
+                ''', (*ARCHIVE_STATUSES, cutoff, batch_size))]
+                if not ids:
+                    break
+                placeholders = ', '.join('?' * len(ids))
+                conn.execute(f'''
+                    INSERT OR IGNORE INTO archive.job_applications ({STORED_COLUMNS})
+                    SELECT {STORED_COLUMNS} FROM main.job_applications WHERE id IN ({placeholders})
+                ''', ids)
+                conn.commit()
+                conn.execute(f'DELETE FROM main.job_applications WHERE id IN ({placeholders})', ids)
+                conn.commit()
+                moved += len(ids)
+        return moved
     
+    @traced
+    @cached_read
+    def get_archive_stats(self) -> dict:
+        """Get the number of hot and archived applications and the newest archived date."""
+        with self.pool.connection() as conn:
+            hot = conn.execute('SELECT COALESCE(SUM(count), 0) FROM status_counts').fetchone()[0]
+            archived, horizon = conn.execute(
+                'SELECT COUNT(*), MAX(application_date) FROM archive.job_applications'
+            ).fetchone()
+        return {'hot': hot, 'archived': archived, 'horizon': horizon}
+    
+    @traced
+    @cached_read
     def get_all_applications(self) -> List[JobApplication]:
-        """Retrieve all job applications from the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        """Retrieve all job applications from the database, archived ones included."""
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(conn, ApplicationFilters(), include_archive=True)
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT * FROM job_applications 
+            cursor.execute(f'''
+                SELECT {APPLICATION_COLUMNS} FROM {source} 
                 ORDER BY application_date DESC
-            ''')
+            ''', params)
             rows = cursor.fetchall()
             
             applications = []
@@ -80,53 +1018,678 @@ class DatabaseManager:
                 ))
             return applications
     
+    @traced
+    @cached_read
+    def get_application_summaries(self, filters: Optional[ApplicationFilters] = None) -> List[ApplicationSummary]:
+        """Retrieve the filtered applications without their large text fields."""
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(conn, filters or ApplicationFilters())
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT {SUMMARY_COLUMNS} FROM {source}
+                ORDER BY application_date DESC
+            ''', params)
+            return [ApplicationSummary(*row) for row in cursor.fetchall()]
+    
+    def get_application(self, application_id: int) -> Optional[JobApplication]:
+        """Retrieve one complete application, including description and notes."""
+        applications = self.get_applications([application_id])
+        return applications[0] if applications else None
+    
+    @traced
+    def get_applications(self, application_ids: Iterable[int]) -> List[JobApplication]:
+        """Retrieve complete applications by primary key, in the order requested.
+        
+        Records already loaded by this DatabaseManager are served from its
+        identity map without touching the database, as long as no write has
+        been committed since they were loaded. Ids not in the hot table are
+        looked up in the archive; unknown ids are skipped.
+        """
+        self.identity_map.sync_version(self.pool.data_version())
+        application_ids = list(application_ids)
+        found = {}
+        for application_id in dict.fromkeys(application_ids):
+            application = self.identity_map.get(application_id)
+            if application is not None:
+                found[application_id] = application
+        missing = [application_id for application_id in dict.fromkeys(application_ids) if application_id not in found]
+        
+        if missing:
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                for schema in ('main', 'archive'):
+                    for start in range(0, len(missing), LOOKUP_BATCH_SIZE):
+                        batch = missing[start:start + LOOKUP_BATCH_SIZE]
+                        placeholders = ', '.join('?' * len(batch))
+                        cursor.execute(
+                            f'SELECT {APPLICATION_COLUMNS} FROM {schema}.job_applications WHERE id IN ({placeholders})',
+                            batch
+                        )
+                        for row in cursor.fetchall():
+                            application = JobApplication(*row)
+                            found[application.id] = application
+                            self.identity_map.put(application.id, application)
+                    missing = [application_id for application_id in missing if application_id not in found]
+                    if not missing:
+                        break
+        
+        return [found[application_id] for application_id in application_ids if application_id in found]
+    
+    @traced
     def update_application(self, application_id: int, application: JobApplication) -> bool:
         """Update an existing job application."""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                UPDATE job_applications 
-                SET job_title=?, company_name=?, location=?, application_date=?, 
-                    status=?, salary_range=?, job_description=?, notes=?,
-                    updated_at=CURRENT_TIMESTAMP
-                WHERE id=?
-            ''', (
-                application.job_title,
-                application.company_name,
-                application.location,
-                application.application_date,
-                application.status,
-                application.salary_range,
-                application.job_description,
-                application.notes,
-                application_id
-            ))
-            conn.commit()
-            return cursor.rowcount > 0
+        return self.submit_update_application(application_id, application).result()
     
+    @traced
     def delete_application(self, application_id: int) -> bool:
         """Delete a job application from the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        return self.submit_delete_application(application_id).result()
+    
+    @traced
+    def find_duplicates(self, application: JobApplication,
+                        exclude_id: Optional[int] = None) -> List[ApplicationSummary]:
+        """Get stored applications with the same normalized company, title and location.
+        
+        One lookup on the dedup_hash index of each tier, so archived
+        applications match too; pass exclude_id when checking an edit so the
+        application doesn't match itself.
+        """
+        *_, key = dedup_keys(application.company_name, application.job_title, application.location)
+        with self.pool.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('DELETE FROM job_applications WHERE id=?', (application_id,))
-            conn.commit()
-            return cursor.rowcount > 0
+            cursor.execute(f'''
+                SELECT {SUMMARY_COLUMNS} FROM main.job_applications
+                WHERE dedup_hash = ? AND id IS NOT ?
+                UNION ALL
+                SELECT {SUMMARY_COLUMNS} FROM archive.job_applications
+                WHERE dedup_hash = ? AND id IS NOT ?
+                ORDER BY application_date DESC, id DESC
+            ''', (key, exclude_id, key, exclude_id))
+            return [ApplicationSummary(*row) for row in cursor.fetchall()]
     
+    @traced
+    @cached_read
     def get_applications_df(self) -> pd.DataFrame:
-        """Get all applications as a pandas DataFrame."""
-        with sqlite3.connect(self.db_path) as conn:
-            return pd.read_sql_query('''
-                SELECT * FROM job_applications 
+        """Get all applications, archived ones included, as a DataFrame with datetime64 dates and categorical status, company and location."""
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(conn, ApplicationFilters(), include_archive=True)
+            return _typed_frame(pd.read_sql_query(f'''
+                SELECT * FROM {source} 
+                ORDER BY application_date DESC
+            ''', conn, params=params))
+    
+    def _where_clause(self, filters: ApplicationFilters, schema: str = 'main'):
+        """Build a parameterized WHERE clause for the given filters on one tier's table."""
+        conditions = []
+        params = []
+        
+        fts_query = build_fts_query(filters.search) if self.fts_enabled else None
+        if fts_query:
+            fts_table = 'job_applications_fts' if schema == 'main' else f'{schema}.job_applications_fts'
+            conditions.append(
+                f'id IN (SELECT rowid FROM {fts_table} WHERE job_applications_fts MATCH ?)'
+            )
+            params.append(fts_query)
+        elif filters.search:
+            pattern = '%' + filters.search.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            conditions.append('''(
+                job_title LIKE ? ESCAPE '\\' OR
+                company_name LIKE ? ESCAPE '\\' OR
+                location LIKE ? ESCAPE '\\' OR
+                job_description LIKE ? ESCAPE '\\' OR
+                notes LIKE ? ESCAPE '\\'
+            )''')
+            params.extend([pattern] * 5)
+        
+        if filters.statuses:
+            placeholders = ', '.join('?' * len(filters.statuses))
+            conditions.append(f'status IN ({placeholders})')
+            params.extend(filters.statuses)
+        
+        if filters.date_from:
+            conditions.append('application_date >= ?')
+            params.append(filters.date_from)
+        
+        if filters.date_to:
+            conditions.append('application_date <= ?')
+            params.append(filters.date_to)
+        
+        if filters.salary_currency:
+            # Overlap test against the requested range; a missing bound is taken to equal the other
+            conditions.append('salary_currency = ?')
+            params.append(filters.salary_currency)
+            if filters.salary_min is not None:
+                conditions.append('COALESCE(salary_max, salary_min) >= ?')
+                params.append(filters.salary_min)
+            if filters.salary_max is not None:
+                conditions.append('COALESCE(salary_min, salary_max) <= ?')
+                params.append(filters.salary_max)
+        
+        where = ('WHERE ' + ' AND '.join(conditions)) if conditions else ''
+        return where, params
+    
+    def _reaches_archive(self, conn: sqlite3.Connection, filters: ApplicationFilters) -> bool:
+        """Whether the date filter overlaps the archived applications' dates.
+        
+        A filter without any date bound stays on the hot table; one with only
+        a single bound is open-ended on the other side.
+        """
+        if not (filters.date_from or filters.date_to):
+            return False
+        oldest, newest = conn.execute('''
+            SELECT (SELECT MIN(application_date) FROM archive.job_applications),
+                   (SELECT MAX(application_date) FROM archive.job_applications)
+        ''').fetchone()
+        if newest is None:
+            return False
+        return ((not filters.date_from or filters.date_from <= newest) and
+                (not filters.date_to or filters.date_to >= oldest))
+    
+    def _from_clause(self, conn: sqlite3.Connection, filters: ApplicationFilters,
+                     condition: Optional[str] = None, condition_params: Iterable = (),
+                     include_archive: bool = False):
+        """Build the FROM target and parameters for the filtered applications.
+        
+        Only the hot table is read unless the date filter reaches the archive
+        or `include_archive` is set, as it is for bulk readers; then both tiers
+        are combined with UNION ALL and the WHERE clause, plus any extra
+        `condition`, is pushed into each branch so both use their indexes.
+        The result replaces `job_applications WHERE ...` in a query.
+        """
+        reaches_archive = include_archive or self._reaches_archive(conn, filters)
+        schemas = ['main', 'archive'] if reaches_archive else ['main']
+        branches = []
+        params = []
+        for schema in schemas:
+            where, branch_params = self._where_clause(filters, schema)
+            if condition:
+                where += (' AND ' if where else 'WHERE ') + condition
+                branch_params.extend(condition_params)
+            branches.append((schema, where))
+            params.extend(branch_params)
+        
+        if len(branches) == 1:
+            return f'job_applications {branches[0][1]}', params
+        union = ' UNION ALL '.join(
+            f'SELECT {STORED_COLUMNS} FROM {schema}.job_applications {where}' for schema, where in branches
+        )
+        return f'({union})', params
+    
+    @traced
+    @cached_read
+    def query_applications(self, search: Optional[str] = None, statuses: Optional[List[str]] = None,
+                           date_from: Optional[str] = None, date_to: Optional[str] = None,
+                           limit: Optional[int] = None, include_archive: bool = False) -> pd.DataFrame:
+        """Get applications matching the filters as a pandas DataFrame."""
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(
+                conn, ApplicationFilters(search, statuses, date_from, date_to), include_archive=include_archive
+            )
+            sql = f'''
+                SELECT {SUMMARY_COLUMNS} FROM {source}
                 ORDER BY application_date DESC
-            ''', conn)
+            '''
+            if limit is not None:
+                sql += ' LIMIT ?'
+                params.append(limit)
+            return _typed_frame(pd.read_sql_query(sql, conn, params=params))
     
+    @traced
+    @cached_read
+    def get_applications_page(self, filters: ApplicationFilters, page_size: int,
+                              after: Optional[Tuple[str, int]] = None):
+        """Get one page of filtered applications using keyset pagination.
+        
+        Rows are ordered by (application_date, id) descending and `after` is the
+        key of the last row on the previous page, so each page is an index seek
+        rather than an OFFSET scan. Returns the page and the cursor for the next
+        page, or None when this is the last page.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        with self.pool.connection() as conn:
+            if after is not None:
+                source, params = self._from_clause(conn, filters, '(application_date, id) < (?, ?)', after)
+            else:
+                source, params = self._from_clause(conn, filters)
+            page = _typed_frame(pd.read_sql_query(f'''
+                SELECT {SUMMARY_COLUMNS} FROM {source}
+                ORDER BY application_date DESC, id DESC
+                LIMIT ?
+            ''', conn, params=params + [page_size + 1]))
+        
+        next_cursor = None
+        if len(page) > page_size:
+            page = page.iloc[:page_size]
+            last = page.iloc[-1]
+            next_cursor = (last['application_date'].strftime('%Y-%m-%d'), int(last['id']))
+        return page, next_cursor
+    
+    def iter_applications(self, filters: Optional[ApplicationFilters] = None,
+                          chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """Stream (column names, rows) chunks of the filtered applications from a cursor.
+        
+        Only the application fields are included, not the derived salary and
+        dedup columns. Without filters this is a full export, so archived
+        applications are included whatever the date range.
+        """
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(
+                conn, filters or ApplicationFilters(), include_archive=filters is None
+            )
+            cursor = conn.execute(f'''
+                SELECT {APPLICATION_COLUMNS} FROM {source}
+                ORDER BY application_date DESC, id DESC
+            ''', params)
+            columns = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield columns, rows
+    
+    def iter_changed_applications(self, since: Optional[str] = None,
+                                  chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[Tuple[List[str], List[tuple]]]:
+        """Stream (column names, rows) chunks of applications updated at or after `since`.
+        
+        Both tiers are read, so archiving doesn't drop rows from snapshots.
+        updated_at has one-second resolution, so the comparison is inclusive and
+        callers should expect to see rows from the boundary second again.
+        """
+        condition, condition_params = ('updated_at >= ?', [since]) if since else (None, [])
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(
+                conn, ApplicationFilters(), condition, condition_params, include_archive=True
+            )
+            cursor = conn.execute(f'''
+                SELECT * FROM {source}
+                ORDER BY id
+            ''', params)
+            columns = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield columns, rows
+    
+    def get_application_ids(self) -> List[int]:
+        """Get the ids of every application, archived ones included, in ascending order."""
+        with self.pool.connection() as conn:
+            return [row[0] for row in conn.execute('''
+                SELECT id FROM main.job_applications
+                UNION ALL
+                SELECT id FROM archive.job_applications
+                ORDER BY id
+            ''')]
+    
+    def is_archived(self, application_id: int) -> bool:
+        """Whether an application has been moved to the read-only archive tier."""
+        with self.pool.connection() as conn:
+            return conn.execute(
+                'SELECT 1 FROM archive.job_applications WHERE id=?', (application_id,)
+            ).fetchone() is not None
+    
+    def get_column_names(self) -> List[str]:
+        """Get the application columns included in exports, in iter_applications order."""
+        return [field.name for field in fields(JobApplication)]
+    
+    def get_column_types(self) -> Dict[str, str]:
+        """Get the declared SQLite type of each job_applications column."""
+        with self.pool.connection() as conn:
+            return {row[1]: row[2] for row in conn.execute('PRAGMA table_info(job_applications)')}
+    
+    @traced
+    @cached_read
+    def search_applications(self, text: str, limit: int = 50) -> pd.DataFrame:
+        """Full-text search ranked by relevance, titles and companies weighted highest.
+        
+        Archived applications are searched too, since a lookup by name is how
+        old applications are usually found. bm25 scores each tier against its
+        own index statistics, which is close enough to merge the two rankings.
+        """
+        fts_query = build_fts_query(text)
+        if not fts_query:
+            return self.query_applications(limit=0)
+        if not self.fts_enabled:
+            return self.query_applications(search=text, limit=limit, include_archive=True)
+        
+        branches = ' UNION ALL '.join(f'''
+            SELECT {', '.join('a.' + field for field in SUMMARY_FIELDS)},
+                   bm25(job_applications_fts, 10.0, 8.0, 4.0, 1.0, 2.0) AS rank
+            FROM {schema}.job_applications_fts
+            JOIN {schema}.job_applications a ON a.id = job_applications_fts.rowid
+            WHERE job_applications_fts MATCH ?
+        ''' for schema in ('main', 'archive'))
+        with self.pool.connection() as conn:
+            return _typed_frame(pd.read_sql_query(f'''
+                SELECT {SUMMARY_COLUMNS} FROM ({branches})
+                ORDER BY rank
+                LIMIT ?
+            ''', conn, params=[fts_query, fts_query, limit]))
+    
+    def _sync_autocomplete(self):
+        """Load the autocomplete index on first use, or reload it after outside writes.
+        
+        Writes made through a DatabaseManager in this process update the index
+        as they commit. Rows inserted or deleted by another process change the
+        total count, which is checked only when the data version moves.
+        """
+        version = self.pool.data_version()
+        index = self.autocomplete
+        if index.loaded and index.version == version:
+            return
+        
+        with index.refresh_lock:
+            if index.loaded and index.version == version:
+                return
+            with self.pool.connection() as conn:
+                conn.execute('BEGIN')
+                rows = conn.execute('SELECT COALESCE(SUM(count), 0) FROM status_counts').fetchone()[0]
+                if not index.loaded or rows != index.rows:
+                    counts = {
+                        field: dict(conn.execute(f'''
+                            SELECT {field}, COUNT(*) FROM job_applications GROUP BY {field}
+                        '''))
+                        for field in AUTOCOMPLETE_FIELDS
+                    }
+                    index.load(counts, rows)
+                conn.commit()
+            index.version = version
+    
+    @traced
+    def get_suggestions(self, field: str, prefix: str = '',
+                        limit: Optional[int] = AUTOCOMPLETE_LIMIT) -> List[str]:
+        """Get stored values of company_name, job_title or location with a word starting with `prefix`.
+        
+        Served from the in-memory prefix index, most used first; an empty
+        prefix returns the most used values.
+        """
+        if field not in AUTOCOMPLETE_FIELDS:
+            raise ValueError(f"Autocomplete field must be one of {', '.join(AUTOCOMPLETE_FIELDS)}")
+        self._sync_autocomplete()
+        if not prefix.strip():
+            return self.autocomplete.most_common(field, limit)
+        return self.autocomplete.suggest(field, prefix, limit)
+    
+    def cache_stats(self) -> dict:
+        """Get hit/miss counters for the shared query cache."""
+        return self.cache.stats()
+    
+    @traced
+    @cached_read
     def get_status_counts(self) -> dict:
         """Get count of applications by status."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self.pool.connection() as conn:
             cursor = conn.cursor()
-            cursor.execute('''
-                SELECT status, COUNT(*) as count 
-                FROM job_applications 
+            cursor.execute('SELECT status, count FROM status_counts')
+            return dict(cursor.fetchall())
+    
+    @traced
+    @cached_read
+    def get_metrics(self, filters: Optional[ApplicationFilters] = None) -> dict:
+        """Get dashboard counts, rates and the per-status breakdown for the filtered set.
+        
+        A single GROUP BY status query yields the breakdown, and the total,
+        responded, interviewed and offered counts are sums over its groups, so
+        the metric cards and the status chart always describe the same rows.
+        """
+        filters = filters or ApplicationFilters()
+        if filters.is_empty():
+            return summarize_status_counts(self.get_status_counts())
+        
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(conn, filters)
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT status, COUNT(*) AS count
+                FROM {source}
                 GROUP BY status
+            ''', params)
+            return summarize_status_counts(dict(cursor.fetchall()))
+    
+    @traced
+    @cached_read
+    def get_date_span(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get the earliest and latest application dates."""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('SELECT MIN(application_date), MAX(application_date) FROM daily_counts')
+            return cursor.fetchone()
+    
+    @traced
+    @cached_read
+    def get_timeline_counts(self, filters: Optional[ApplicationFilters] = None,
+                            bucket: str = 'day') -> pd.DataFrame:
+        """Get application counts per day, week or month, oldest first.
+        
+        Weeks start on Monday and months are labelled by their first day.
+        Date-only filters on the hot tier are answered from the daily_counts
+        summary table; search, status and salary filters, and date ranges
+        reaching the archive, need a GROUP BY over the matching rows.
+        """
+        period = TIMELINE_BUCKET_SQL[bucket]
+        filters = filters or ApplicationFilters()
+        with self.pool.connection() as conn:
+            if filters.has_row_filters() or self._reaches_archive(conn, filters):
+                source, params = self._from_clause(conn, filters)
+                count = 'COUNT(*)'
+            else:
+                where, params = self._where_clause(filters)
+                source, count = f'daily_counts {where}', 'SUM(count)'
+            timeline = pd.read_sql_query(f'''
+                SELECT {period} AS period, {count} AS count
+                FROM {source}
+                GROUP BY period
+                ORDER BY period
+            ''', conn, params=params)
+        timeline['period'] = pd.to_datetime(timeline['period'], format='%Y-%m-%d')
+        return timeline
+    
+    @traced
+    @cached_read
+    def get_company_counts(self, filters: Optional[ApplicationFilters] = None,
+                           limit: int = 10) -> dict:
+        """Get the companies with the most applications, largest first."""
+        filters = filters or ApplicationFilters()
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            if filters.is_empty():
+                cursor.execute('''
+                    SELECT company_name, count FROM company_counts
+                    ORDER BY count DESC, company_name
+                    LIMIT ?
+                ''', (limit,))
+            else:
+                source, params = self._from_clause(conn, filters)
+                cursor.execute(f'''
+                    SELECT company_name, COUNT(*) AS count
+                    FROM {source}
+                    GROUP BY company_name
+                    ORDER BY count DESC, company_name
+                    LIMIT ?
+                ''', params + [limit])
+            return dict(cursor.fetchall())
+    
+    @traced
+    @cached_read
+    def get_salary_currencies(self) -> dict:
+        """Get the number of applications with a parsed salary per currency, largest first."""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT salary_currency, COUNT(*) AS count
+                FROM job_applications
+                WHERE salary_currency IS NOT NULL
+                GROUP BY salary_currency
+                ORDER BY count DESC, salary_currency
             ''')
-            return dict(cursor.fetchall())
\ No newline at end of file
+            return dict(cursor.fetchall())
+    
+    @traced
+    @cached_read
+    def get_salary_span(self, currency: str) -> Tuple[Optional[float], Optional[float]]:
+        """Get the lowest and highest annual salary bound recorded in a currency."""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT MIN(COALESCE(salary_min, salary_max)), MAX(COALESCE(salary_max, salary_min))
+                FROM job_applications
+                WHERE salary_currency = ?
+            ''', (currency,))
+            return cursor.fetchone()
+    
+    @traced
+    @cached_read
+    def get_salary_histogram(self, filters: Optional[ApplicationFilters] = None,
+                             currency: Optional[str] = None, bins: int = 20) -> pd.DataFrame:
+        """Get equal-width bins of the filtered applications' salary midpoints.
+        
+        Only one currency can be binned at a time: the filter's currency when
+        set, otherwise `currency`. Returns salary_from, salary_to and count
+        columns, omitting empty bins.
+        """
+        filters = filters or ApplicationFilters()
+        currency = filters.salary_currency or currency
+        if not currency:
+            return pd.DataFrame(columns=['salary_from', 'salary_to', 'count'])
+        
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(
+                conn, filters, 'salary_currency = ? AND COALESCE(salary_min, salary_max) IS NOT NULL', [currency]
+            )
+            return pd.read_sql_query(f'''
+                WITH salaries AS (
+                    SELECT (COALESCE(salary_min, salary_max) + COALESCE(salary_max, salary_min)) / 2.0 AS midpoint
+                    FROM {source}
+                ),
+                bounds AS (
+                    SELECT MIN(midpoint) AS low, (MAX(midpoint) - MIN(midpoint)) / ? AS width
+                    FROM salaries
+                ),
+                binned AS (
+                    SELECT CASE WHEN width > 0 THEN MIN(CAST((midpoint - low) / width AS INTEGER), ? - 1)
+                                ELSE 0 END AS bin
+                    FROM salaries, bounds
+                )
+                SELECT low + bin * width AS salary_from,
+                       low + (bin + 1) * width AS salary_to,
+                       COUNT(*) AS count
+                FROM binned, bounds
+                GROUP BY bin
+                ORDER BY bin
+            ''', conn, params=params + [bins, bins])
+    
+    @traced
+    @cached_read
+    def get_status_history(self, application_id: int) -> List[Tuple[str, str]]:
+        """Get the (status, changed_at) events of one application, oldest first."""
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute('''
+                SELECT status, changed_at FROM status_events
+                WHERE application_id = ?
+                ORDER BY changed_at, id
+            ''', (application_id,))
+            return cursor.fetchall()
+    
+    @traced
+    @cached_read
+    def get_funnel(self, filters: Optional[ApplicationFilters] = None) -> pd.DataFrame:
+        """Count the filtered applications that ever reached each pipeline stage.
+        
+        An application counts towards every stage up to the furthest one in
+        its status history, so later rejections don't erase earlier progress.
+        Returns stage, reached and conversion (percent of the first stage).
+        """
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(conn, filters or ApplicationFilters())
+            cursor = conn.cursor()
+            cursor.execute(f'''
+                SELECT rank, COUNT(*) FROM (
+                    SELECT MAX({STAGE_RANK_SQL}) AS rank
+                    FROM status_events
+                    WHERE application_id IN (SELECT id FROM {source})
+                    GROUP BY application_id
+                )
+                GROUP BY rank
+            ''', STAGE_RANK_PARAMS + params)
+            furthest = dict(cursor.fetchall())
+        
+        # Applications reach a stage when their furthest stage is at or beyond it
+        reached = []
+        total = 0
+        for rank in reversed(range(len(PIPELINE_STAGES))):
+            total += furthest.get(rank, 0)
+            reached.append(total)
+        reached.reverse()
+        first = reached[0]
+        return pd.DataFrame({
+            'stage': PIPELINE_STAGES,
+            'reached': reached,
+            'conversion': [round(count / first * 100, 1) if first else 0.0 for count in reached]
+        })
+    
+    @traced
+    @cached_read
+    def get_time_in_stage(self, filters: Optional[ApplicationFilters] = None) -> pd.DataFrame:
+        """Get the median days the filtered applications spent in each status before the next change.
+        
+        Durations come from LEAD() over each application's events; the current
+        status of an application has no end yet and is left out. Returns
+        status, median_days and transitions (the number of durations).
+        """
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(conn, filters or ApplicationFilters())
+            return pd.read_sql_query(f'''
+                WITH durations AS (
+                    SELECT status,
+                           julianday(LEAD(changed_at) OVER (
+                               PARTITION BY application_id ORDER BY changed_at, id
+                           )) - julianday(changed_at) AS days
+                    FROM status_events
+                    WHERE application_id IN (SELECT id FROM {source})
+                ),
+                ordered AS (
+                    SELECT status, days,
+                           ROW_NUMBER() OVER (PARTITION BY status ORDER BY days) AS position,
+                           COUNT(*) OVER (PARTITION BY status) AS total
+                    FROM durations
+                    WHERE days IS NOT NULL
+                )
+                SELECT status, AVG(days) AS median_days, MAX(total) AS transitions
+                FROM ordered
+                WHERE position IN ((total + 1) / 2, (total + 2) / 2)
+                GROUP BY status
+            ''', conn, params=params)
+    
+    @traced
+    @cached_read
+    def get_duplicate_report(self, min_count: int = 2) -> pd.DataFrame:
+        """Group applications sharing a dedup hash, largest groups first.
+        
+        Candidates in both tiers are bucketed by the hash in one GROUP BY,
+        so this stays linear in the table size and agrees with
+        find_duplicates. Returns dedup_hash, one spelling of
+        company_name, job_title and location, count, first_applied,
+        last_applied and the ids in each group.
+        """
+        with self.pool.connection() as conn:
+            source, params = self._from_clause(conn, ApplicationFilters(), include_archive=True)
+            report = pd.read_sql_query(f'''
+                SELECT dedup_hash,
+                       MIN(company_name) AS company_name,
+                       MIN(job_title) AS job_title,
+                       MIN(location) AS location,
+                       COUNT(*) AS count,
+                       MIN(application_date) AS first_applied,
+                       MAX(application_date) AS last_applied,
+                       GROUP_CONCAT(id) AS ids
+                FROM {source}
+                GROUP BY dedup_hash
+                HAVING COUNT(*) >= ?
+                ORDER BY count DESC, last_applied DESC
+            ''', conn, params=params + [min_count])
+        report['ids'] = [sorted(int(i) for i in ids.split(',')) for ids in report['ids']]
+        for column in ('first_applied', 'last_applied'):
+            report[column] = pd.to_datetime(report[column], format='ISO8601', errors='coerce')
+        return report
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""Normalize company, title and location text into keys for duplicate detection.
+
+Examples:
+    "Google Inc." / "google"                            -> 'google'
+    "Sr. Software Engineer" / "senior software eng"     -> 'senior software engineer'
+    "New York, NY" / "new york ny"                      -> 'new york ny'
+
+Applications whose three keys match share a dedup hash, so candidates are
+found with an index lookup or a GROUP BY instead of comparing every pair.
+"""
+import hashlib
+import re
+import unicodedata
+from typing import List, Optional, Tuple
+
+DedupKeys = Tuple[str, str, str, str]
+
+# Legal-entity words dropped from the end of company names
+COMPANY_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'llp', 'ltd', 'limited', 'corp', 'corporation',
+    'co', 'company', 'gmbh', 'ag', 'sa', 'plc', 'pvt', 'private', 'pte', 'bv', 'oy',
+}
+
+TITLE_ABBREVIATIONS = {
+    'sr': 'senior', 'snr': 'senior', 'jr': 'junior', 'jnr': 'junior',
+    'eng': 'engineer', 'engr': 'engineer', 'dev': 'developer', 'mgr': 'manager',
+    'assoc': 'associate', 'swe': 'software engineer', 'sde': 'software engineer',
+}
+
+_TOKEN = re.compile(r'[a-z0-9]+')
+_INITIAL = re.compile(r'\b([a-z])\.(?=[a-z]\.)')
+
+def _tokens(text: Optional[str]) -> List[str]:
+    # Fold accents so "Nestlé" and "Nestle" match
+    text = unicodedata.normalize('NFKD', text or '').encode('ascii', 'ignore').decode('ascii')
+    text = text.lower().replace('&', ' and ')
+    # Join dotted initials, so "S.A." becomes "sa" and "I.B.M." becomes "ibm"
+    return _TOKEN.findall(_INITIAL.sub(r'\1', text))
+
+def normalize_company(name: Optional[str]) -> str:
+    """Lower-case the name and drop punctuation, a leading "the" and legal suffixes."""
+    tokens = _tokens(name)
+    if len(tokens) > 1 and tokens[0] == 'the':
+        tokens = tokens[1:]
+    while len(tokens) > 1 and tokens[-1] in COMPANY_SUFFIXES:
+        tokens.pop()
+    return ' '.join(tokens)
+
+def normalize_title(title: Optional[str]) -> str:
+    """Lower-case the title, drop punctuation and expand common abbreviations."""
+    return ' '.join(TITLE_ABBREVIATIONS.get(token, token) for token in _tokens(title))
+
+def normalize_location(location: Optional[str]) -> str:
+    """Lower-case the location and drop punctuation."""
+    return ' '.join(_tokens(location))
+
+def dedup_hash(company_key: str, title_key: str, location_key: str) -> str:
+    """Short, stable hash of the three normalized keys."""
+    joined = '\x1f'.join((company_key, title_key, location_key))
+    return hashlib.blake2b(joined.encode('utf-8'), digest_size=8).hexdigest()
+
+def dedup_keys(company_name: Optional[str], job_title: Optional[str],
+               location: Optional[str]) -> DedupKeys:
+    """Get (company_key, title_key, location_key, dedup_hash) for an application."""
+    company_key = normalize_company(company_name)
+    title_key = normalize_title(job_title)
+    location_key = normalize_location(location)
+    return company_key, title_key, location_key, dedup_hash(company_key, title_key, location_key)
@@ -0,0 +1,187 @@
+"""Bulk import job applications from CSV or JSON exports.
+
+Usage:
+    python importer.py applications.csv
+    python importer.py export.json --batch-size 5000 --rejects rejects.csv
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+from database import DatabaseManager
+from models import JobApplication
+from config import IMPORT_BATCH_SIZE
+
+# Column names used by other trackers and ATS exports
+FIELD_ALIASES = {
+    'title': 'job_title',
+    'position': 'job_title',
+    'role': 'job_title',
+    'company': 'company_name',
+    'employer': 'company_name',
+    'city': 'location',
+    'date': 'application_date',
+    'applied': 'application_date',
+    'applied_on': 'application_date',
+    'date_applied': 'application_date',
+    'stage': 'status',
+    'salary': 'salary_range',
+    'compensation': 'salary_range',
+    'description': 'job_description',
+    'comments': 'notes',
+}
+
+JSON_CHUNK_SIZE = 64 * 1024
+
+@dataclass
+class ImportReport:
+    inserted: int = 0
+    rejected: List[Tuple[int, str]] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.inserted / self.elapsed if self.elapsed > 0 else 0.0
+
+def normalize_keys(row: dict) -> dict:
+    """Map a raw row's column names onto JobApplication fields."""
+    normalized = {}
+    for key, value in row.items():
+        if key is None:
+            continue
+        name = key.strip().lower().replace(' ', '_').replace('-', '_')
+        normalized[FIELD_ALIASES.get(name, name)] = value
+    return normalized
+
+def _iter_csv(path: Path) -> Iterator[Tuple[int, dict]]:
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            yield reader.line_num, row
+
+def _iter_json_lines(path: Path) -> Iterator[Tuple[int, object]]:
+    with open(path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, start=1):
+            if line.strip():
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield line_number, e
+
+def _iter_json_array(path: Path) -> Iterator[Tuple[int, object]]:
+    """Decode the items of a top-level JSON array one at a time."""
+    decoder = json.JSONDecoder()
+    with open(path, encoding='utf-8') as f:
+        buffer = f.read(JSON_CHUNK_SIZE).lstrip()
+        if not buffer.startswith('['):
+            raise ValueError(f"{path} does not contain a JSON array")
+        buffer = buffer[1:]
+        item_number = 0
+        exhausted = False
+        while True:
+            buffer = buffer.lstrip().lstrip(',').lstrip()
+            if buffer.startswith(']'):
+                return
+            try:
+                item, end = decoder.raw_decode(buffer)
+            except json.JSONDecodeError:
+                if exhausted:
+                    raise ValueError(f"{path} ends with a truncated or malformed JSON item")
+                chunk = f.read(JSON_CHUNK_SIZE)
+                exhausted = not chunk
+                buffer += chunk
+                continue
+            item_number += 1
+            buffer = buffer[end:]
+            yield item_number, item
+
+def iter_rows(path: Path, fmt: Optional[str] = None) -> Iterator[Tuple[int, object]]:
+    """Stream (row number, row) pairs from a CSV, JSON array or JSON lines file."""
+    fmt = fmt or path.suffix.lower().lstrip('.')
+    if fmt == 'csv':
+        return _iter_csv(path)
+    if fmt in ('jsonl', 'ndjson'):
+        return _iter_json_lines(path)
+    if fmt == 'json':
+        return _iter_json_array(path)
+    raise ValueError(f"Unsupported import format '{fmt}'")
+
+def import_rows(rows: Iterator[Tuple[int, object]], db_manager: DatabaseManager,
+                batch_size: int = IMPORT_BATCH_SIZE) -> ImportReport:
+    """Validate rows and insert the valid ones in batched transactions.
+
+    Invalid rows are recorded in the report's rejects. A file that can't be
+    read any further, like a truncated JSON array, is recorded as a reject at
+    the item where reading stopped.
+    """
+    report = ImportReport()
+    rows = iter(rows)
+
+    def valid_applications():
+        row_number = 0
+        while True:
+            try:
+                row_number, row = next(rows)
+            except StopIteration:
+                return
+            except ValueError as e:
+                # A malformed JSON array can't be read past the bad item, so
+                # reject it and keep the rows inserted so far
+                report.rejected.append((row_number + 1, str(e)))
+                return
+            if isinstance(row, Exception):
+                report.rejected.append((row_number, str(row)))
+                continue
+            if not isinstance(row, dict):
+                report.rejected.append((row_number, 'row is not an object'))
+                continue
+            try:
+                yield JobApplication.from_dict(normalize_keys(row))
+            except ValueError as e:
+                report.rejected.append((row_number, str(e)))
+
+    start = time.perf_counter()
+    report.inserted = db_manager.bulk_insert(valid_applications(), batch_size)
+    report.elapsed = time.perf_counter() - start
+    return report
+
+def import_file(path, db_manager: Optional[DatabaseManager] = None,
+                batch_size: int = IMPORT_BATCH_SIZE, fmt: Optional[str] = None) -> ImportReport:
+    """Import every row of a CSV or JSON file into the database."""
+    db_manager = db_manager or DatabaseManager()
+    return import_rows(iter_rows(Path(path), fmt), db_manager, batch_size)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bulk import job applications from CSV or JSON.")
+    parser.add_argument('path', help="CSV, JSON array or JSON lines file to import")
+    parser.add_argument('--format', choices=['csv', 'json', 'jsonl'], help="Override format detection")
+    parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help="Rows per transaction")
+    parser.add_argument('--database', help="Database file (defaults to config.DATABASE_PATH)")
+    parser.add_argument('--rejects', help="Write rejected rows to this CSV file")
+    args = parser.parse_args(argv)
+
+    db_manager = DatabaseManager(args.database) if args.database else DatabaseManager()
+    report = import_file(args.path, db_manager, args.batch_size, args.format)
+
+    print(f"Imported {report.inserted} applications in {report.elapsed:.2f}s "
+          f"({report.rows_per_second:,.0f} rows/s), rejected {len(report.rejected)}")
+
+    if args.rejects:
+        with open(args.rejects, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['row', 'error'])
+            writer.writerows(report.rejected)
+    else:
+        for row_number, error in report.rejected[:20]:
+            print(f"  row {row_number}: {error}", file=sys.stderr)
+        if len(report.rejected) > 20:
+            print(f"  ... {len(report.rejected) - 20} more (use --rejects to save them all)", file=sys.stderr)
+
+    return 0 if not report.rejected else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Lightweight timing spans for dashboard reruns and database queries.
+
+A rerun trace is started at the top of app.main() and every stage or
+DatabaseManager query executed while it is active records a span with its
+duration, row count and SQL text. Finished traces can be appended to a
+rotating JSON-lines log and summarized into a Prometheus textfile.
+"""
+import functools
+import json
+import logging
+import logging.handlers
+import os
+import sqlite3
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field, asdict
+from datetime import datetime
+from typing import Dict, List, Optional
+from config import (
+    METRICS_ENABLED,
+    METRICS_LOG_PATH,
+    METRICS_LOG_MAX_BYTES,
+    METRICS_LOG_BACKUPS,
+    METRICS_PROM_PATH,
+    METRICS_WINDOW
+)
+
+@dataclass
+class Span:
+    name: str
+    start_ms: float
+    duration_ms: float = 0.0
+    depth: int = 0
+    rows: Optional[int] = None
+    sql: List[str] = field(default_factory=list)
+    attributes: Dict[str, object] = field(default_factory=dict)
+
+@dataclass
+class RerunTrace:
+    started_at: str
+    start: float = field(default_factory=time.perf_counter)
+    total_ms: float = 0.0
+    spans: List[Span] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, span: Span):
+        with self._lock:
+            self.spans.append(span)
+
+    def to_dict(self) -> dict:
+        return {
+            'started_at': self.started_at,
+            'total_ms': round(self.total_ms, 3),
+            'spans': [
+                {key: value for key, value in asdict(span).items() if value not in (None, [], {})}
+                for span in sorted(self.spans, key=lambda span: span.start_ms)
+            ]
+        }
+
+_current_trace: ContextVar[Optional[RerunTrace]] = ContextVar('current_trace', default=None)
+_current_span: ContextVar[Optional[Span]] = ContextVar('current_span', default=None)
+
+def start_trace() -> RerunTrace:
+    """Begin collecting spans for the current rerun."""
+    trace = RerunTrace(started_at=datetime.now().isoformat(timespec='milliseconds'))
+    _current_trace.set(trace)
+    return trace
+
+def finish_trace(trace: RerunTrace) -> RerunTrace:
+    """Stop collecting spans and export the finished trace."""
+    trace.total_ms = (time.perf_counter() - trace.start) * 1000
+    _current_trace.set(None)
+    _window.record(trace)
+    if METRICS_ENABLED:
+        _export(trace)
+    return trace
+
+@contextmanager
+def span(name: str, rows: Optional[int] = None, **attributes):
+    """Time a block as a span of the active trace; a no-op when no trace is active."""
+    trace = _current_trace.get()
+    if trace is None:
+        yield None
+        return
+
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        start_ms=(time.perf_counter() - trace.start) * 1000,
+        depth=parent.depth + 1 if parent else 0,
+        rows=rows,
+        attributes=attributes
+    )
+    token = _current_span.set(current)
+    start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.duration_ms = (time.perf_counter() - start) * 1000
+        _current_span.reset(token)
+        trace.add(current)
+
+def annotate(**attributes):
+    """Attach attributes, such as a cache hit, to the innermost active span."""
+    current = _current_span.get()
+    if current is not None:
+        current.attributes.update(attributes)
+
+def record_sql(sql: str):
+    """Attach a statement's SQL text to the innermost active span."""
+    current = _current_span.get()
+    if current is not None:
+        current.sql.append(' '.join(sql.split()))
+
+def _row_count(result) -> Optional[int]:
+    if isinstance(result, dict) and 'total_applications' in result:
+        return result['total_applications']
+    if isinstance(result, tuple) and result and hasattr(result[0], '__len__'):
+        result = result[0]
+    if isinstance(result, (str, bytes)) or not hasattr(result, '__len__'):
+        return None
+    return len(result)
+
+def traced(method):
+    """Record a DatabaseManager method call as a span named db.<method>."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _current_trace.get() is None:
+            return method(self, *args, **kwargs)
+        with span(f'db.{method.__name__}') as current:
+            result = method(self, *args, **kwargs)
+            current.rows = _row_count(result)
+            return result
+    return wrapper
+
+class TracedCursor(sqlite3.Cursor):
+    """Cursor that reports the SQL it executes to the active span."""
+
+    def execute(self, sql, parameters=()):
+        record_sql(sql)
+        return super().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        record_sql(sql)
+        return super().executemany(sql, seq_of_parameters)
+
+class TracedConnection(sqlite3.Connection):
+    """Connection whose cursors, including those behind execute(), are traced."""
+
+    def cursor(self, factory=TracedCursor):
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters):
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+def _quantile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(q * (len(ordered) - 1))))
+    return ordered[index]
+
+class MetricsWindow:
+    """Rolling window of recent reruns used for p50/p95 latency summaries."""
+
+    def __init__(self, size: int):
+        self._reruns = deque(maxlen=size)
+        self._stages = {}
+        # Cumulative [count, seconds] per stage since the process started
+        self._stage_totals = {}
+        self._size = size
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+
+    def record(self, trace: RerunTrace):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += trace.total_ms / 1000
+            self._reruns.append(trace.total_ms)
+            for span in trace.spans:
+                self._stages.setdefault(span.name, deque(maxlen=self._size)).append(span.duration_ms)
+                totals = self._stage_totals.setdefault(span.name, [0, 0.0])
+                totals[0] += 1
+                totals[1] += span.duration_ms / 1000
+
+    def summary(self) -> dict:
+        """Get p50/p95 milliseconds for whole reruns and for each stage, plus stage totals."""
+        with self._lock:
+            reruns = list(self._reruns)
+            stages = {name: list(values) for name, values in self._stages.items()}
+            totals = {name: tuple(values) for name, values in self._stage_totals.items()}
+        if not reruns:
+            return {'reruns': 0, 'p50_ms': 0, 'p95_ms': 0, 'stages': {}}
+        return {
+            'reruns': len(reruns),
+            'p50_ms': _quantile(reruns, 0.5),
+            'p95_ms': _quantile(reruns, 0.95),
+            'stages': {
+                name: {
+                    'p50_ms': _quantile(values, 0.5),
+                    'p95_ms': _quantile(values, 0.95),
+                    'count': totals[name][0],
+                    'total_seconds': totals[name][1]
+                }
+                for name, values in sorted(stages.items())
+            }
+        }
+
+_window = MetricsWindow(METRICS_WINDOW)
+
+def latency_summary() -> dict:
+    """Get p50/p95 latencies over the recent reruns of this process."""
+    return _window.summary()
+
+_logger = None
+_export_lock = threading.Lock()
+
+def _get_logger() -> logging.Logger:
+    global _logger
+    if _logger is None:
+        METRICS_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            METRICS_LOG_PATH, maxBytes=METRICS_LOG_MAX_BYTES, backupCount=METRICS_LOG_BACKUPS
+        )
+        handler.setFormatter(logging.Formatter('%(message)s'))
+        logger = logging.getLogger('tracker.metrics')
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        logger.addHandler(handler)
+        _logger = logger
+    return _logger
+
+def _escape_label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"')
+
+def write_prometheus_textfile(path=METRICS_PROM_PATH):
+    """Write rerun and stage latency summaries in Prometheus textfile format."""
+    summary = latency_summary()
+    lines = [
+        '# HELP tracker_rerun_duration_seconds Wall time of a dashboard rerun.',
+        '# TYPE tracker_rerun_duration_seconds summary',
+        f'tracker_rerun_duration_seconds{{quantile="0.5"}} {summary["p50_ms"] / 1000:.6f}',
+        f'tracker_rerun_duration_seconds{{quantile="0.95"}} {summary["p95_ms"] / 1000:.6f}',
+        f'tracker_rerun_duration_seconds_sum {_window.total_seconds:.6f}',
+        f'tracker_rerun_duration_seconds_count {_window.count}',
+        '# HELP tracker_stage_duration_seconds Wall time of a rerun stage or database query.',
+        '# TYPE tracker_stage_duration_seconds summary',
+    ]
+    for name, stage in summary['stages'].items():
+        label = _escape_label(name)
+        lines.append(f'tracker_stage_duration_seconds{{stage="{label}",quantile="0.5"}} {stage["p50_ms"] / 1000:.6f}')
+        lines.append(f'tracker_stage_duration_seconds{{stage="{label}",quantile="0.95"}} {stage["p95_ms"] / 1000:.6f}')
+        lines.append(f'tracker_stage_duration_seconds_sum{{stage="{label}"}} {stage["total_seconds"]:.6f}')
+        lines.append(f'tracker_stage_duration_seconds_count{{stage="{label}"}} {stage["count"]}')
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'w') as f:
+        f.write('\n'.join(lines) + '\n')
+    # Replace atomically so node_exporter never reads a partial file
+    os.replace(temp_path, path)
+
+def _export(trace: RerunTrace):
+    try:
+        with _export_lock:
+            _get_logger().info(json.dumps(trace.to_dict(), default=str))
+            write_prometheus_textfile()
+    except OSError:
+        logging.getLogger(__name__).exception("Failed to export rerun metrics")
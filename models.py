@@ -1,7 +1,15 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional, List
 import sqlite3
 from dataclasses import dataclass
+from config import STATUS_OPTIONS, NO_RESPONSE_STATUSES, OFFER_STATUSES
+
+SUMMARY_FIELDS = (
+    'id', 'job_title', 'company_name', 'location',
+    'application_date', 'status', 'salary_range'
+)
+REQUIRED_FIELDS = ('job_title', 'company_name', 'location', 'application_date', 'status')
+OPTIONAL_FIELDS = ('salary_range', 'job_description', 'notes')
 
 @dataclass
 class JobApplication:
@@ -30,4 +38,105 @@ class JobApplication:
             'notes': self.notes,
             'created_at': self.created_at,
             'updated_at': self.updated_at
-        }
\ No newline at end of file
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'JobApplication':
+        """Build a validated application from an imported row.
+
+        Raises ValueError describing the first problem found.
+        """
+        values = {}
+        for field in REQUIRED_FIELDS + OPTIONAL_FIELDS:
+            value = data.get(field)
+            if value is not None and not isinstance(value, str):
+                value = str(value)
+            value = value.strip() if value else None
+            if field in REQUIRED_FIELDS and not value:
+                raise ValueError(f"missing required field '{field}'")
+            values[field] = value
+
+        try:
+            values['application_date'] = datetime.strptime(
+                values['application_date'][:10], '%Y-%m-%d'
+            ).strftime('%Y-%m-%d')
+        except ValueError:
+            raise ValueError(f"invalid application_date '{values['application_date']}', expected YYYY-MM-DD")
+
+        statuses = {status.lower(): status for status in STATUS_OPTIONS}
+        status = statuses.get(values['status'].lower())
+        if status is None:
+            raise ValueError(f"unknown status '{values['status']}'")
+        values['status'] = status
+
+        return cls(id=None, **values)
+
+@dataclass(frozen=True, slots=True)
+class ApplicationSummary:
+    """Lightweight row for lists and tables, without the large text fields."""
+    id: int
+    job_title: str
+    company_name: str
+    location: str
+    application_date: str
+    status: str
+    salary_range: Optional[str] = None
+
+def summarize_status_counts(status_counts: dict) -> dict:
+    """Derive the dashboard counts and rates from a per-status breakdown."""
+    total = sum(status_counts.values())
+    responded = sum(count for status, count in status_counts.items() if status not in NO_RESPONSE_STATUSES)
+    interviewed = sum(count for status, count in status_counts.items() if 'interview' in status.lower())
+    offered = sum(count for status, count in status_counts.items() if status in OFFER_STATUSES)
+
+    return {
+        'total_applications': total,
+        'responded': responded,
+        'interviewed': interviewed,
+        'offered': offered,
+        'response_rate': (responded / total * 100) if total > 0 else 0,
+        'interview_rate': (interviewed / total * 100) if total > 0 else 0,
+        'offer_rate': (offered / total * 100) if total > 0 else 0,
+        'status_counts': status_counts
+    }
+
+@dataclass
+class ApplicationFilters:
+    search: Optional[str] = None
+    statuses: Optional[List[str]] = None
+    date_from: Optional[str] = None
+    date_to: Optional[str] = None
+    # Annual pay bounds; only applied together with a currency
+    salary_currency: Optional[str] = None
+    salary_min: Optional[float] = None
+    salary_max: Optional[float] = None
+
+    @classmethod
+    def from_inputs(cls, search_term: str, status_filter: list, date_range,
+                    salary_currency: Optional[str] = None, salary_range=None) -> 'ApplicationFilters':
+        """Build filters from the sidebar widgets, ignoring incomplete date ranges."""
+        date_from = date_to = None
+        if date_range and len(date_range) == 2:
+            date_from, date_to = (
+                d.strftime('%Y-%m-%d') if isinstance(d, (date, datetime)) else d
+                for d in date_range
+            )
+        salary_min = salary_max = None
+        if salary_currency and salary_range:
+            salary_min, salary_max = salary_range
+        return cls(
+            search=search_term.strip() if search_term else None,
+            statuses=list(status_filter) if status_filter else None,
+            date_from=date_from,
+            date_to=date_to,
+            salary_currency=salary_currency or None,
+            salary_min=salary_min,
+            salary_max=salary_max
+        )
+
+    def is_empty(self) -> bool:
+        return not (self.date_from or self.date_to or self.has_row_filters())
+
+    def has_row_filters(self) -> bool:
+        """Whether any filter besides the date range is set, so per-day summaries can't answer it."""
+        return bool(self.search or self.statuses or self.salary_currency)
\ No newline at end of file
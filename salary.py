@@ -0,0 +1,171 @@
+"""Normalize free-text salary ranges into numeric annual bounds and a currency.
+
+Examples:
+    "$100k - $150k"        -> (100000.0, 150000.0, 'USD')
+    "120,000-140,000 EUR"  -> (120000.0, 140000.0, 'EUR')
+    "£45/hr"               -> (93600.0, 93600.0, 'GBP')
+    "৳80,000 per month"    -> (960000.0, 960000.0, 'BDT')
+    "12-15 LPA"            -> (1200000.0, 1500000.0, 'INR')
+    "$55/hour to $65/hour" -> (114400.0, 135200.0, 'USD')
+    "€60.000 - €70.000"    -> (60000.0, 70000.0, 'EUR')
+"""
+import re
+from typing import Optional, Tuple
+
+SalaryBounds = Tuple[Optional[float], Optional[float], Optional[str]]
+
+EMPTY_SALARY: SalaryBounds = (None, None, None)
+
+CURRENCY_SYMBOLS = {
+    'US$': 'USD', 'CA$': 'CAD', 'C$': 'CAD', 'A$': 'AUD', 'S$': 'SGD',
+    '$': 'USD', '€': 'EUR', '£': 'GBP', '₹': 'INR', '৳': 'BDT', '¥': 'JPY',
+}
+CURRENCY_CODES = {
+    'USD', 'EUR', 'GBP', 'INR', 'BDT', 'CAD', 'AUD', 'SGD', 'JPY', 'CHF',
+    'SEK', 'NOK', 'DKK', 'PLN', 'NZD', 'AED', 'PKR',
+}
+CURRENCY_WORDS = {'TK': 'BDT', 'TAKA': 'BDT', 'RS': 'INR', 'LPA': 'INR'}
+
+# Multipliers that turn an hourly, daily, weekly or monthly figure into a yearly one
+HOURS_PER_YEAR = 2080
+PERIOD_MULTIPLIERS = [
+    (re.compile(r'/\s*h(?:ou)?r\b|\bper\s+hour\b|\bhourly\b|\ban\s+hour\b', re.I), HOURS_PER_YEAR),
+    (re.compile(r'/\s*day\b|\bper\s+day\b|\bdaily\b', re.I), 260),
+    (re.compile(r'/\s*w(?:ee)?k\b|\bper\s+week\b|\bweekly\b', re.I), 52),
+    (re.compile(r'/\s*mo(?:nth)?\b|\bper\s+month\b|\bmonthly\b|\bp\.?m\.?$', re.I), 12),
+    (re.compile(r'/\s*y(?:ea)?r\b|\bper\s+(?:year|annum)\b|\bannually\b|\ba\s+year\b|\bp\.a\.', re.I), 1),
+]
+
+SUFFIX_MULTIPLIERS = {'k': 1e3, 'm': 1e6, 'mn': 1e6, 'l': 1e5, 'lakh': 1e5, 'lakhs': 1e5,
+                      'lac': 1e5, 'lacs': 1e5, 'lpa': 1e5, 'cr': 1e7, 'crore': 1e7}
+
+# Dot-grouped thousands ("60.000,50"), comma-grouped ("120,000.50", "12,00,000") or plain ("12.5")
+_NUMBER = re.compile(
+    r'(?P<number>\d{1,3}(?:\.\d{3})+(?:,\d+)?|\d+(?:,\d{2,3})+(?:\.\d+)?|\d+(?:[.,]\d+)?)'
+    r'\s*(?P<suffix>lakhs?|lacs?|lpa|crore|cr|mn|[kml])?\b',
+    re.I
+)
+# How far before the first chosen figure and after the last one to look for
+# units and bound words, so "3 days/week onsite" elsewhere in the text is ignored
+CONTEXT_CHARS = 20
+_UPPER_BOUND = re.compile(r'\b(?:up\s*to|max(?:imum)?|under)\b', re.I)
+_LOWER_BOUND = re.compile(r'\b(?:from|min(?:imum)?|starting|at\s+least)\b', re.I)
+# Right after a figure: "90k max", "90k minimum", "90k or more", or a "+"
+# attached to it ("$100k+"), but not a spaced one ("$120k + equity")
+_UPPER_BOUND_AFTER = re.compile(r'[\s,(]*(?:max(?:imum)?|or\s+less)\b', re.I)
+_LOWER_BOUND_AFTER = re.compile(r'\+|[\s,(]*(?:min(?:imum)?|or\s+more|and\s+(?:up|above))\b', re.I)
+_RANGE_SEPARATOR = re.compile(r'^\s*(?:-|–|—|to)\s*$', re.I)
+_SYMBOL = re.compile('|'.join(re.escape(symbol) for symbol in CURRENCY_SYMBOLS))
+_WORD = re.compile(r'[A-Za-z]+')
+
+def _is_currency_word(word: str) -> bool:
+    return word.upper() in CURRENCY_CODES or word.upper() in CURRENCY_WORDS
+
+def _currency(text: str) -> Optional[str]:
+    for word in _WORD.findall(text):
+        upper = word.upper()
+        if upper in CURRENCY_CODES:
+            return upper
+        if upper in CURRENCY_WORDS:
+            return CURRENCY_WORDS[upper]
+    match = _SYMBOL.search(text)
+    return CURRENCY_SYMBOLS[match.group()] if match else None
+
+def _period_multiplier(text: str) -> int:
+    for pattern, multiplier in PERIOD_MULTIPLIERS:
+        if pattern.search(text):
+            return multiplier
+    return 1
+
+def _number_value(number: str, has_suffix: bool) -> float:
+    """Read a figure whose dots and commas may be decimal marks or thousands separators."""
+    if '.' in number and ',' in number:
+        # Whichever comes last is the decimal mark
+        decimal, grouping = ('.', ',') if number.rfind('.') > number.rfind(',') else (',', '.')
+        return float(number.replace(grouping, '').replace(decimal, '.'))
+    for mark in '.,':
+        if mark not in number:
+            continue
+        digits_after = len(number) - number.rfind(mark) - 1
+        # One mark before exactly three digits groups thousands, as in "60.000" or
+        # "120,000", unless a suffix follows ("1.500k" is 1500); more than one always does
+        if number.count(mark) > 1 or (digits_after == 3 and not (has_suffix and mark == '.')):
+            return float(number.replace(mark, ''))
+        return float(number.replace(mark, '.'))
+    return float(number)
+
+def _is_anchored(text: str, match: re.Match) -> bool:
+    """Whether a figure carries a k/M-style suffix or sits next to a currency marker."""
+    if match.group('suffix'):
+        return True
+    before = text[:match.start()].rstrip()
+    if any(before.endswith(symbol) for symbol in CURRENCY_SYMBOLS):
+        return True
+    word_before = re.search(r'[A-Za-z]+$', before)
+    if word_before and _is_currency_word(word_before.group()):
+        return True
+    word_after = _WORD.match(text[match.end():].lstrip())
+    return word_after is not None and _is_currency_word(word_after.group())
+
+def _joins_range(gap: str) -> bool:
+    """Whether the text between two figures is a dash or "to", ignoring units and currencies."""
+    for pattern, _ in PERIOD_MULTIPLIERS:
+        gap = pattern.sub(' ', gap)
+    gap = _SYMBOL.sub(' ', gap)
+    gap = _WORD.sub(lambda word: ' ' if _is_currency_word(word.group()) else word.group(), gap)
+    return bool(_RANGE_SEPARATOR.match(re.sub(r'[^\w\-–—\s]', '', gap)))
+
+def parse_salary(text: Optional[str]) -> SalaryBounds:
+    """Parse salary text into (annual minimum, annual maximum, ISO currency code).
+
+    A single figure gives equal bounds, "up to" only sets the maximum and
+    "from" or "$100k+" only the minimum. Figures with a currency marker or a
+    k/M suffix are preferred over bare numbers, so "2 years experience,
+    $100k" reads as $100k, and units and bound words are only read next to
+    the chosen figures. Anything without a number yields all Nones.
+    """
+    if not text or not text.strip():
+        return EMPTY_SALARY
+
+    numbers = list(_NUMBER.finditer(text))
+    if not numbers:
+        return EMPTY_SALARY
+
+    # Start at the first figure that looks like money, or the bare figure
+    # joined to it as the lower end of a range ("100-150k")
+    start = next((i for i, match in enumerate(numbers) if _is_anchored(text, match)), 0)
+    if start > 0 and _joins_range(text[numbers[start - 1].end():numbers[start].start()]):
+        start -= 1
+    # Text just before the chosen figures, stopping at any earlier figure
+    before_start = max(numbers[start - 1].end() if start > 0 else 0, numbers[start].start() - CONTEXT_CHARS)
+    before = text[before_start:numbers[start].start()]
+    following = numbers[start + 2] if len(numbers) > start + 2 else None
+    numbers = numbers[start:start + 2]
+
+    values = []
+    for match in numbers:
+        suffix = (match.group('suffix') or '').lower()
+        values.append((_number_value(match.group('number'), bool(suffix)), SUFFIX_MULTIPLIERS.get(suffix)))
+
+    # Only treat two figures as a range when they are joined by a dash or "to"
+    is_range = len(values) == 2 and _joins_range(text[numbers[0].end():numbers[1].start()])
+    if not is_range:
+        values = values[:1]
+        following = numbers[1] if len(numbers) > 1 else following
+        numbers = numbers[:1]
+    if len(values) == 2 and values[0][1] is None:
+        # "100-150k": the suffix on the upper bound applies to both
+        values[0] = (values[0][0], values[1][1])
+
+    # Units and bound words only count next to the chosen figures
+    after_end = min(following.start() if following else len(text), numbers[-1].end() + CONTEXT_CHARS)
+    after = text[numbers[-1].end():after_end]
+    multiplier = _period_multiplier(text[before_start:after_end])
+    amounts = [value * (suffix or 1) * multiplier for value, suffix in values]
+    low, high = min(amounts), max(amounts)
+
+    if not is_range and (_UPPER_BOUND.search(before) or _UPPER_BOUND_AFTER.match(after)):
+        low = None
+    elif not is_range and (_LOWER_BOUND.search(before) or _LOWER_BOUND_AFTER.match(after)):
+        high = None
+    return low, high, _currency(text)
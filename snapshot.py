@@ -0,0 +1,224 @@
+"""Columnar Arrow snapshots of the job_applications table for analytics.
+
+A snapshot directory holds uncompressed Arrow IPC (Feather v2) part files and
+a manifest.json. The first run writes every row; later runs append a part
+with only the rows whose updated_at is at or after the previous watermark,
+along with the ids still in the table so deleted rows drop out on load.
+Dates are stored as timestamps and status, company and location as
+dictionary-encoded (categorical) columns, so loading needs no re-parsing.
+
+load_snapshot() memory-maps the parts, keeps the newest version of each row
+and returns a DataFrame. pyarrow is optional and only imported here.
+
+Usage:
+    python snapshot.py --output snapshots/
+    python snapshot.py --output snapshots/ --full
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+import pandas as pd
+from database import DatabaseManager, CATEGORY_COLUMNS
+from config import STATUS_OPTIONS, EXPORT_CHUNK_SIZE, SNAPSHOT_DIR, SNAPSHOT_MAX_PARTS
+
+MANIFEST_NAME = 'manifest.json'
+DATETIME_TYPES = ('DATE', 'DATETIME', 'TIMESTAMP')
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.ipc
+    except ImportError as e:
+        raise ImportError("Snapshots need pyarrow; install it with `pip install pyarrow`") from e
+    return pyarrow
+
+def _arrow_schema(pa, column_types: Dict[str, str]):
+    """Map the table's declared SQLite types to a fixed Arrow schema."""
+    arrow_fields = []
+    for column, declared in column_types.items():
+        declared = declared.upper()
+        if column in CATEGORY_COLUMNS:
+            # int32 indices so the dictionary can keep growing across batches
+            arrow_type = pa.dictionary(pa.int32(), pa.string())
+        elif declared in DATETIME_TYPES:
+            arrow_type = pa.timestamp('s')
+        elif 'INT' in declared:
+            arrow_type = pa.int64()
+        elif declared in ('REAL', 'FLOAT', 'DOUBLE'):
+            arrow_type = pa.float64()
+        else:
+            arrow_type = pa.string()
+        arrow_fields.append(pa.field(column, arrow_type))
+    return pa.schema(arrow_fields)
+
+class _BatchEncoder:
+    """Convert row chunks to record batches with stable, append-only dictionaries.
+
+    An IPC file may only extend a dictionary between batches, never replace
+    it, so each categorical column keeps one growing list of categories.
+    """
+
+    def __init__(self, pa, schema):
+        self.pa = pa
+        self.schema = schema
+        self.categories = {
+            column: list(STATUS_OPTIONS) if column == 'status' else []
+            for column in schema.names if column in CATEGORY_COLUMNS
+        }
+
+    def encode(self, columns: List[str], rows: List[tuple]):
+        df = pd.DataFrame.from_records(rows, columns=columns)
+        for column in columns:
+            arrow_type = self.schema.field(column).type
+            if column in self.categories:
+                known = self.categories[column]
+                seen = set(known)
+                known.extend(sorted(value for value in df[column].dropna().unique() if value not in seen))
+                df[column] = pd.Categorical(df[column], categories=known)
+            elif self.pa.types.is_timestamp(arrow_type):
+                df[column] = pd.to_datetime(df[column], errors='coerce', format='ISO8601').astype('datetime64[s]')
+        return self.pa.RecordBatch.from_pandas(df, schema=self.schema, preserve_index=False)
+
+def _read_manifest(directory: Path) -> Optional[dict]:
+    path = directory / MANIFEST_NAME
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
+
+def _write_manifest(directory: Path, manifest: dict):
+    path = directory / MANIFEST_NAME
+    temp_path = path.with_name(path.name + '.tmp')
+    with open(temp_path, 'w') as f:
+        json.dump(manifest, f, indent=2)
+    # Readers only ever see a complete manifest pointing at complete parts
+    os.replace(temp_path, path)
+
+def _read_ipc(pa, path: Path):
+    with pa.memory_map(str(path)) as source:
+        return pa.ipc.open_file(source).read_all()
+
+def _write_ipc(pa, path: Path, table):
+    with pa.OSFile(str(path), 'wb') as sink:
+        with pa.ipc.new_file(sink, table.schema, options=pa.ipc.IpcWriteOptions(unify_dictionaries=True)) as writer:
+            writer.write_table(table)
+
+def _remove_unreferenced(directory: Path, manifest: dict):
+    referenced = set(manifest['parts']) | {manifest['live_ids'], MANIFEST_NAME}
+    for path in directory.glob('*.arrow'):
+        if path.name not in referenced:
+            path.unlink(missing_ok=True)
+
+def write_snapshot(db_manager: DatabaseManager, directory=SNAPSHOT_DIR, full: bool = False,
+                   chunk_size: int = EXPORT_CHUNK_SIZE) -> dict:
+    """Write a full or incremental snapshot; returns the updated manifest."""
+    pa = _require_pyarrow()
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    previous = _read_manifest(directory)
+    # File names never repeat, so readers still mapping old parts are unaffected
+    sequence = previous['sequence'] + 1 if previous else 0
+    schema = _arrow_schema(pa, db_manager.get_column_types())
+    manifest = previous
+    if full or (manifest and manifest['schema'] != schema.to_string(show_schema_metadata=False)):
+        # A full rewrite, or columns changed since the last snapshot
+        manifest = None
+
+    part_name = f"part-{sequence:05d}.arrow"
+    since = manifest['watermark'] if manifest else None
+    # Taken before reading, in CURRENT_TIMESTAMP's format, so later writes are
+    # picked up by the next run and only this second's writes are read twice
+    watermark = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+    encoder = _BatchEncoder(pa, schema)
+    rows_written = 0
+    with pa.OSFile(str(directory / part_name), 'wb') as sink:
+        options = pa.ipc.IpcWriteOptions(emit_dictionary_deltas=True)
+        with pa.ipc.new_file(sink, schema, options=options) as writer:
+            for columns, rows in db_manager.iter_changed_applications(since, chunk_size):
+                writer.write_batch(encoder.encode(columns, rows))
+                rows_written += len(rows)
+
+    live_ids_name = f"live_ids-{sequence:05d}.arrow"
+    live_ids = pa.table({'id': pa.array(db_manager.get_application_ids(), pa.int64())})
+    _write_ipc(pa, directory / live_ids_name, live_ids)
+
+    parts = (manifest['parts'] if manifest else []) + ([part_name] if rows_written or not manifest else [])
+    manifest = {
+        'format': 'arrow-ipc',
+        'schema': schema.to_string(show_schema_metadata=False),
+        'sequence': sequence,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'watermark': watermark,
+        'rows': live_ids.num_rows,
+        'parts': parts,
+        'live_ids': live_ids_name
+    }
+    _write_manifest(directory, manifest)
+    _remove_unreferenced(directory, manifest)
+
+    if len(parts) > SNAPSHOT_MAX_PARTS:
+        manifest = compact_snapshot(directory)
+    return manifest
+
+def load_snapshot_table(directory=SNAPSHOT_DIR):
+    """Memory-map the snapshot as a pyarrow Table with one current row per live id."""
+    pa = _require_pyarrow()
+    directory = Path(directory)
+    manifest = _read_manifest(directory)
+    if manifest is None:
+        raise FileNotFoundError(f"No snapshot manifest in {directory}")
+
+    table = pa.concat_tables(
+        [_read_ipc(pa, directory / part) for part in manifest['parts']],
+        promote_options='default'
+    )
+    live_ids = _read_ipc(pa, directory / manifest['live_ids']).column('id').to_numpy()
+    ids = pd.Series(table.column('id').to_numpy())
+    # Later parts hold newer versions of a row; deleted ids are absent from live_ids
+    keep = ~ids.duplicated(keep='last') & ids.isin(live_ids)
+    if keep.all():
+        return table
+    return table.filter(pa.array(keep.to_numpy()))
+
+def load_snapshot(directory=SNAPSHOT_DIR) -> pd.DataFrame:
+    """Load the snapshot as a DataFrame with datetime and categorical columns."""
+    return load_snapshot_table(directory).to_pandas()
+
+def compact_snapshot(directory=SNAPSHOT_DIR) -> dict:
+    """Rewrite the current rows of a snapshot as a single part."""
+    pa = _require_pyarrow()
+    directory = Path(directory)
+    manifest = _read_manifest(directory)
+    table = load_snapshot_table(directory)
+    part_name = f"part-{manifest['sequence']:05d}-compact.arrow"
+    _write_ipc(pa, directory / part_name, table)
+    manifest = dict(manifest, parts=[part_name])
+    _write_manifest(directory, manifest)
+    _remove_unreferenced(directory, manifest)
+    return manifest
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write a columnar Arrow snapshot of the applications.")
+    parser.add_argument('--output', default=str(SNAPSHOT_DIR), help="Snapshot directory")
+    parser.add_argument('--database', help="Database file (defaults to config.DATABASE_PATH)")
+    parser.add_argument('--full', action='store_true', help="Rewrite everything instead of appending changes")
+    parser.add_argument('--compact', action='store_true', help="Merge the parts into one after writing")
+    args = parser.parse_args(argv)
+
+    db_manager = DatabaseManager(args.database) if args.database else DatabaseManager()
+    start = time.perf_counter()
+    manifest = write_snapshot(db_manager, args.output, full=args.full)
+    if args.compact:
+        manifest = compact_snapshot(args.output)
+    elapsed = time.perf_counter() - start
+    print(f"Snapshot of {manifest['rows']} applications in {len(manifest['parts'])} part(s), "
+          f"watermark {manifest['watermark']}, in {elapsed:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,128 @@
+"""Reproducible synthetic job application datasets for load testing.
+
+Usage:
+    python synthetic_data.py 100000 --database bench.db --seed 42
+"""
+import argparse
+import random
+import sys
+import time
+from datetime import date, timedelta
+from typing import Iterator, Optional
+from database import DatabaseManager
+from models import JobApplication
+from config import STATUS_OPTIONS, IMPORT_BATCH_SIZE
+
+COMPANIES = [
+    "Google", "Meta", "Amazon", "Apple", "Microsoft", "Netflix", "Stripe", "Shopify",
+    "Airbnb", "Uber", "Lyft", "Spotify", "Atlassian", "Salesforce", "Oracle", "IBM",
+    "Intel", "NVIDIA", "AMD", "Adobe", "Dropbox", "Slack", "Zoom", "Twilio", "Datadog",
+    "Snowflake", "Databricks", "Cloudflare", "GitLab", "GitHub", "HashiCorp", "MongoDB",
+    "Elastic", "Confluent", "Palantir", "Robinhood", "Coinbase", "Square", "PayPal",
+    "Wise", "Revolut", "Monzo", "Klarna", "Booking.com", "Expedia", "Zillow", "Pinterest",
+    "Reddit", "Discord", "Figma", "Notion", "Canva", "Grab", "Gojek", "bKash", "Pathao",
+    "Brain Station 23", "Optimizely", "Therap BD", "Samsung R&D", "Siemens", "SAP",
+]
+
+SENIORITIES = ["", "", "Junior ", "Senior ", "Staff ", "Lead ", "Principal "]
+
+ROLES = [
+    "Software Engineer", "Backend Engineer", "Frontend Engineer", "Full Stack Developer",
+    "Data Scientist", "Data Engineer", "Machine Learning Engineer", "DevOps Engineer",
+    "Site Reliability Engineer", "Product Manager", "QA Engineer", "Mobile Developer",
+    "Security Engineer", "Data Analyst", "Engineering Manager", "Solutions Architect",
+]
+
+LOCATIONS = [
+    "San Francisco, CA", "New York, NY", "Seattle, WA", "Austin, TX", "Boston, MA",
+    "London, UK", "Berlin, Germany", "Amsterdam, Netherlands", "Dublin, Ireland",
+    "Toronto, Canada", "Singapore", "Dhaka, Bangladesh", "Bangalore, India", "Remote",
+    "Remote (US)", "Remote (EU)", "Sydney, Australia", "Tokyo, Japan",
+]
+
+# Rough shape of a real search: most applications never get past the first stages
+STATUS_WEIGHTS = {
+    "Applied": 34,
+    "Phone Screen": 8,
+    "Technical Interview": 6,
+    "Onsite Interview": 3,
+    "Final Interview": 2,
+    "Offered": 1.5,
+    "Accepted": 0.5,
+    "Rejected": 30,
+    "Withdrawn": 5,
+    "Follow-up": 10,
+}
+
+DESCRIPTION_WORDS = (
+    "build scalable distributed systems services python java go kubernetes cloud "
+    "aws gcp azure data pipelines apis microservices team ownership customers "
+    "product design review mentoring on-call reliability performance latency "
+    "analytics experimentation machine learning models sql postgres streaming "
+    "kafka spark collaborate stakeholders roadmap impact growth remote hybrid"
+).split()
+
+def _salary_range(rng: random.Random) -> Optional[str]:
+    if rng.random() < 0.35:
+        return None
+    low = rng.randrange(40, 220, 5)
+    high = low + rng.randrange(10, 80, 5)
+    style = rng.random()
+    if style < 0.6:
+        return f"${low}k - ${high}k"
+    if style < 0.8:
+        return f"{low * 1000:,}-{high * 1000:,} USD"
+    if style < 0.9:
+        return f"€{low}k - €{high}k"
+    return f"£{low * 1000:,}"
+
+def _text(rng: random.Random, min_words: int, max_words: int) -> str:
+    return ' '.join(rng.choices(DESCRIPTION_WORDS, k=rng.randint(min_words, max_words))).capitalize() + '.'
+
+def generate_applications(count: int, seed: int = 42, end_date: date = date(2025, 12, 31),
+                          years: int = 3) -> Iterator[JobApplication]:
+    """Yield `count` realistic applications; the same seed always yields the same data."""
+    rng = random.Random(seed)
+    # Skew company popularity so a few companies dominate, as in real searches
+    company_weights = [1 / (rank + 1) for rank in range(len(COMPANIES))]
+    statuses = [status for status in STATUS_OPTIONS if status in STATUS_WEIGHTS]
+    status_weights = [STATUS_WEIGHTS[status] for status in statuses]
+    span_days = years * 365
+
+    for _ in range(count):
+        # Application volume ramps up towards the end of the period
+        days_ago = int(span_days * (1 - rng.random() ** 0.5))
+        application_date = end_date - timedelta(days=days_ago)
+        yield JobApplication(
+            id=None,
+            job_title=rng.choice(SENIORITIES) + rng.choice(ROLES),
+            company_name=rng.choices(COMPANIES, weights=company_weights)[0],
+            location=rng.choice(LOCATIONS),
+            application_date=application_date.strftime('%Y-%m-%d'),
+            status=rng.choices(statuses, weights=status_weights)[0],
+            salary_range=_salary_range(rng),
+            job_description=_text(rng, 20, 400) if rng.random() < 0.7 else None,
+            notes=_text(rng, 3, 30) if rng.random() < 0.4 else None
+        )
+
+def populate(db_manager: DatabaseManager, count: int, seed: int = 42,
+             batch_size: int = IMPORT_BATCH_SIZE) -> int:
+    """Insert a synthetic dataset into the database; returns the rows inserted."""
+    return db_manager.bulk_insert(generate_applications(count, seed), batch_size)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic job application dataset.")
+    parser.add_argument('count', type=int, help="Number of applications to generate")
+    parser.add_argument('--database', required=True, help="Database file to populate")
+    parser.add_argument('--seed', type=int, default=42, help="Random seed")
+    parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE, help="Rows per transaction")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    inserted = populate(DatabaseManager(args.database), args.count, args.seed, args.batch_size)
+    elapsed = time.perf_counter() - start
+    print(f"Generated {inserted} applications in {elapsed:.2f}s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,40 @@
+import pytest
+from database import DatabaseManager
+from models import ApplicationFilters, JobApplication
+from utils import export_csv_stream
+
+@pytest.fixture
+def db_manager(tmp_path):
+    db_manager = DatabaseManager(tmp_path / 'tracker.db')
+    for month in range(1, 6):
+        db_manager.add_application(JobApplication(
+            None, 'Data Engineer', 'Acme', 'Remote', f'2019-0{month}-01', 'Rejected'
+        ))
+    for month in range(1, 4):
+        db_manager.add_application(JobApplication(
+            None, 'Backend Engineer', 'Globex', 'Berlin', f'2099-0{month}-01', 'Applied'
+        ))
+    assert db_manager.archive_closed_applications(older_than_days=365) == 5
+    return db_manager
+
+def _exported_rows(export_file) -> int:
+    with export_file:
+        return export_file.read().decode('utf-8').count('\n') - 1
+
+def test_full_export_includes_archived_applications(db_manager):
+    assert _exported_rows(export_csv_stream(db_manager)) == 8
+    assert _exported_rows(export_csv_stream(db_manager, chunk_size=2)) == 8
+
+def test_filtered_export_follows_the_date_filter(db_manager):
+    assert _exported_rows(export_csv_stream(db_manager, ApplicationFilters(statuses=['Rejected']))) == 0
+    filters = ApplicationFilters(statuses=['Rejected'], date_to='2020-01-01')
+    assert _exported_rows(export_csv_stream(db_manager, filters)) == 5
+
+def test_bulk_readers_cover_both_tiers(db_manager):
+    assert len(db_manager.get_applications_df()) == 8
+    assert len(db_manager.get_application_ids()) == 8
+    assert db_manager.get_metrics()['total_applications'] == 3
+
+def test_search_covers_both_tiers(db_manager):
+    assert len(db_manager.search_applications('engineer')) == 8
+    assert set(db_manager.search_applications('acme')['company_name']) == {'Acme'}
@@ -0,0 +1,45 @@
+import pytest
+from dedup import dedup_hash, dedup_keys, normalize_company, normalize_location, normalize_title
+
+@pytest.mark.parametrize('name, expected', [
+    ("Google Inc.", 'google'),
+    ("google", 'google'),
+    ("The Boeing Company", 'boeing'),
+    ("Nestlé S.A.", 'nestle'),
+    ("I.B.M. Corp", 'ibm'),
+    ("Acme Holdings Pvt. Ltd.", 'acme holdings'),
+    ("AT&T", 'at and t'),
+    ("Co", 'co'),
+    ("The", 'the'),
+    (None, ''),
+])
+def test_normalize_company(name, expected):
+    assert normalize_company(name) == expected
+
+@pytest.mark.parametrize('title, expected', [
+    ("Sr. Software Eng", 'senior software engineer'),
+    ("senior software engineer", 'senior software engineer'),
+    ("SWE II", 'software engineer ii'),
+    ("Jr Dev", 'junior developer'),
+    ("Engineering Mgr.", 'engineering manager'),
+    ("", ''),
+])
+def test_normalize_title(title, expected):
+    assert normalize_title(title) == expected
+
+@pytest.mark.parametrize('location, expected', [
+    ("New York, NY", 'new york ny'),
+    ("  São Paulo ", 'sao paulo'),
+    ("Remote (US)", 'remote us'),
+    (None, ''),
+])
+def test_normalize_location(location, expected):
+    assert normalize_location(location) == expected
+
+def test_equivalent_spellings_share_a_hash():
+    assert (dedup_keys("Google Inc.", "Sr. SWE", "Remote") ==
+            dedup_keys("google", "Senior Software Engineer", "REMOTE"))
+
+def test_hash_separates_fields():
+    assert dedup_hash('a b', 'c', '') != dedup_hash('a', 'b c', '')
+    assert len(dedup_hash('google', 'engineer', 'remote')) == 16
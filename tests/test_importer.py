@@ -0,0 +1,22 @@
+import json
+from database import DatabaseManager
+from importer import import_file
+
+ROW = {'job_title': 'Engineer', 'company_name': 'Acme', 'location': 'Remote',
+       'application_date': '2024-01-01', 'status': 'Applied'}
+
+def test_truncated_json_array_is_rejected_after_the_valid_items(tmp_path):
+    path = tmp_path / 'export.json'
+    path.write_text('[' + json.dumps(ROW) + ',\n' + json.dumps(ROW) + ',\n{"job_title": "Eng')
+    db_manager = DatabaseManager(tmp_path / 'tracker.db')
+    report = import_file(path, db_manager)
+    assert report.inserted == 2
+    assert [row_number for row_number, _ in report.rejected] == [3]
+    assert len(db_manager.get_application_ids()) == 2
+
+def test_json_lines_rejects_bad_lines(tmp_path):
+    path = tmp_path / 'export.jsonl'
+    path.write_text(json.dumps(ROW) + '\n{not json}\n' + json.dumps(dict(ROW, status='Nope')) + '\n')
+    report = import_file(path, DatabaseManager(tmp_path / 'tracker.db'))
+    assert report.inserted == 1
+    assert [row_number for row_number, _ in report.rejected] == [2, 3]
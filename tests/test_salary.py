@@ -0,0 +1,68 @@
+import pytest
+from salary import EMPTY_SALARY, parse_salary
+
+@pytest.mark.parametrize('text, expected', [
+    ("$100k - $150k", (100000.0, 150000.0, 'USD')),
+    ("$100K - 130K", (100000.0, 130000.0, 'USD')),
+    ("100-150k", (100000.0, 150000.0, None)),
+    ("120,000-140,000 EUR", (120000.0, 140000.0, 'EUR')),
+    ("100k USD - 120k USD", (100000.0, 120000.0, 'USD')),
+    ("$100k/yr - $120k/yr", (100000.0, 120000.0, 'USD')),
+    ("12-15 LPA", (1200000.0, 1500000.0, 'INR')),
+])
+def test_ranges(text, expected):
+    assert parse_salary(text) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ("£45/hr", (93600.0, 93600.0, 'GBP')),
+    ("$55/hour to $65/hour", (114400.0, 135200.0, 'USD')),
+    ("$1,500/week", (78000.0, 78000.0, 'USD')),
+    ("৳80,000 per month", (960000.0, 960000.0, 'BDT')),
+])
+def test_periods_are_annualized(text, expected):
+    assert parse_salary(text) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ("€60.000 - €70.000", (60000.0, 70000.0, 'EUR')),
+    ("60.000,50 EUR", (60000.5, 60000.5, 'EUR')),
+    ("$120,000.50", (120000.5, 120000.5, 'USD')),
+    ("12,00,000 INR", (1200000.0, 1200000.0, 'INR')),
+    ("€45,50/hr", (94640.0, 94640.0, 'EUR')),
+    ("1.5M", (1500000.0, 1500000.0, None)),
+    ("Rs 12.5 lakh", (1250000.0, 1250000.0, 'INR')),
+])
+def test_decimal_and_grouping_marks(text, expected):
+    assert parse_salary(text) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ("2 years experience, $100k", (100000.0, 100000.0, 'USD')),
+    ("5+ years, 80-90k", (80000.0, 90000.0, None)),
+    ("Team of 12, 95000 EUR", (95000.0, 95000.0, 'EUR')),
+])
+def test_prefers_figures_that_look_like_money(text, expected):
+    assert parse_salary(text) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ("Up to $120k", (None, 120000.0, 'USD')),
+    ("90k max", (None, 90000.0, None)),
+    ("From 90k", (90000.0, None, None)),
+    ("Starting at $60/hr", (124800.0, None, 'USD')),
+    ("$100k+", (100000.0, None, 'USD')),
+    ("80k or more", (80000.0, None, None)),
+])
+def test_open_ended_bounds(text, expected):
+    assert parse_salary(text) == expected
+
+@pytest.mark.parametrize('text, expected', [
+    ("$90k-$110k, 3 days/week onsite", (90000.0, 110000.0, 'USD')),
+    ("Hourly rate $45", (93600.0, 93600.0, 'USD')),
+    ("5+ years, $100k", (100000.0, 100000.0, 'USD')),
+    ("$120k + equity", (120000.0, 120000.0, 'USD')),
+    ("$100k, up to 15% bonus", (100000.0, 100000.0, 'USD')),
+])
+def test_units_and_bounds_are_read_next_to_the_figures(text, expected):
+    assert parse_salary(text) == expected
+
+@pytest.mark.parametrize('text', [None, "", "   ", "negotiable", "DOE"])
+def test_no_figures(text):
+    assert parse_salary(text) == EMPTY_SALARY
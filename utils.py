@@ -1,10 +1,95 @@
+import contextvars
+import csv
+import functools
+import gzip
+import hashlib
+import io
+import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import streamlit as st
-from config import STATUS_COLORS
+from cache import LRUCache
+from models import summarize_status_counts
+from instrumentation import annotate, span
+from config import (
+    STATUS_COLORS,
+    EXPORT_CHUNK_SIZE,
+    EXPORT_SPOOL_MAX_SIZE,
+    TIMELINE_DAILY_MAX_DAYS,
+    TIMELINE_WEEKLY_MAX_DAYS,
+    TIMELINE_WEBGL_THRESHOLD,
+    LOADER_WORKERS,
+    FIGURE_CACHE_SIZE
+)
 
+TIMELINE_LABELS = {'day': 'Daily', 'week': 'Weekly', 'month': 'Monthly'}
+
+# Shared by all sessions so concurrent reruns can't oversubscribe the process
+_executor = ThreadPoolExecutor(max_workers=LOADER_WORKERS, thread_name_prefix='loader')
+
+def run_concurrently(tasks: dict, stage: str = 'task') -> dict:
+    """Run independent zero-argument callables on the loader pool and gather their results.
+    
+    Each task is timed as a `<stage>.<name>` span and runs in a copy of the
+    caller's context so the span attaches to the current rerun. Exceptions
+    are re-raised in the caller.
+    """
+    def run(name, task):
+        with span(f'{stage}.{name}'):
+            return task()
+    
+    futures = {
+        name: _executor.submit(contextvars.copy_context().run, run, name, task)
+        for name, task in tasks.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
+
+# Figures built from identical aggregates, shared by all sessions
+_figure_cache = LRUCache(FIGURE_CACHE_SIZE)
+_MISSING = object()
+
+def fingerprint(*values) -> str:
+    """Hash chart inputs (dicts, DataFrames, scalars) into a short stable digest."""
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        if isinstance(value, pd.DataFrame):
+            digest.update(json.dumps([list(map(str, value.columns)), list(map(str, value.dtypes))]).encode())
+            digest.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+        else:
+            # Dicts keep insertion order, which is also the order charts draw in
+            digest.update(json.dumps(value, default=str).encode())
+        digest.update(b'\x00')
+    return digest.hexdigest()
+
+def cached_figure(build):
+    """Reuse the figure built from the same inputs instead of rebuilding it.
+    
+    Cached figures are shared between sessions and must not be mutated.
+    """
+    @functools.wraps(build)
+    def wrapper(*args, **kwargs):
+        key = (build.__name__, fingerprint(*args, kwargs))
+        fig = _figure_cache.get(key, _MISSING)
+        annotate(cache='miss' if fig is _MISSING else 'hit')
+        if fig is _MISSING:
+            fig = build(*args, **kwargs)
+            _figure_cache.put(key, fig)
+        return fig
+    return wrapper
+
+def figure_cache_stats() -> dict:
+    """Get hit/miss counters for the shared figure cache."""
+    return _figure_cache.stats()
+
+def clear_figure_cache():
+    """Drop every cached figure, e.g. so a benchmark times real builds."""
+    _figure_cache.clear()
+
+@cached_figure
 def create_status_chart(status_counts: dict):
     """Create a donut chart for application status distribution."""
     if not status_counts:
@@ -32,37 +117,49 @@ def create_status_chart(status_counts: dict):
     
     return fig
 
-def create_timeline_chart(df: pd.DataFrame):
-    """Create a timeline chart showing applications over time."""
-    if df.empty:
-        return None
+def choose_timeline_bucket(date_from, date_to) -> str:
+    """Pick day, week or month buckets so the timeline keeps a readable number of points."""
+    if not date_from or not date_to:
+        return 'day'
     
-    # Convert application_date to datetime
-    df['application_date'] = pd.to_datetime(df['application_date'])
+    span = (pd.to_datetime(date_to) - pd.to_datetime(date_from)).days
+    if span <= TIMELINE_DAILY_MAX_DAYS:
+        return 'day'
+    if span <= TIMELINE_WEEKLY_MAX_DAYS:
+        return 'week'
+    return 'month'
+
+@cached_figure
+def create_timeline_chart(timeline: pd.DataFrame, bucket: str = 'day'):
+    """Create a timeline chart from bucketed application counts."""
+    if timeline.empty:
+        return None
     
-    # Group by date and count applications
-    timeline_data = df.groupby('application_date').size().reset_index(name='count')
-    timeline_data = timeline_data.sort_values('application_date')
+    periods = timeline['period']
+    counts = timeline['count']
+    cumulative = counts.cumsum()
+    label = TIMELINE_LABELS.get(bucket, 'Daily')
     
-    # Create cumulative sum
-    timeline_data['cumulative'] = timeline_data['count'].cumsum()
+    # SVG traces get slow with many points; switch to WebGL for long series
+    large = len(timeline) > TIMELINE_WEBGL_THRESHOLD
+    scatter = go.Scattergl if large else go.Scatter
     
     fig = go.Figure()
     
-    # Add daily applications
-    fig.add_trace(go.Scatter(
-        x=timeline_data['application_date'],
-        y=timeline_data['count'],
-        mode='markers+lines',
-        name='Daily Applications',
+    # Add per-bucket applications
+    fig.add_trace(scatter(
+        x=periods,
+        y=counts,
+        mode='lines' if large else 'markers+lines',
+        name=f'{label} Applications',
         line=dict(color='#3b82f6', width=2),
         marker=dict(size=8)
     ))
     
     # Add cumulative applications
-    fig.add_trace(go.Scatter(
-        x=timeline_data['application_date'],
-        y=timeline_data['cumulative'],
+    fig.add_trace(scatter(
+        x=periods,
+        y=cumulative,
         mode='lines',
         name='Cumulative Applications',
         line=dict(color='#10b981', width=3),
@@ -72,7 +169,7 @@ def create_timeline_chart(df: pd.DataFrame):
     fig.update_layout(
         title="Applications Timeline",
         xaxis_title="Date",
-        yaxis=dict(title="Daily Applications", side='left'),
+        yaxis=dict(title=f"{label} Applications", side='left'),
         yaxis2=dict(title="Cumulative Applications", side='right', overlaying='y'),
         height=400,
         showlegend=True
@@ -80,60 +177,147 @@ def create_timeline_chart(df: pd.DataFrame):
     
     return fig
 
-def create_company_chart(df: pd.DataFrame):
+@cached_figure
+def create_company_chart(company_counts: dict):
     """Create a bar chart showing applications by company."""
-    if df.empty:
+    if not company_counts:
         return None
     
-    company_counts = df['company_name'].value_counts().head(10)
-    
     fig = px.bar(
-        x=company_counts.values,
-        y=company_counts.index,
+        x=list(company_counts.values()),
+        y=list(company_counts.keys()),
         orientation='h',
         title="Top Companies Applied To",
         labels={'x': 'Number of Applications', 'y': 'Company'},
-        color=company_counts.values,
+        color=list(company_counts.values()),
         color_continuous_scale='viridis'
     )
     
     fig.update_layout(height=400, showlegend=False)
     return fig
 
+@cached_figure
+def create_funnel_chart(funnel: pd.DataFrame, time_in_stage: pd.DataFrame):
+    """Create a pipeline funnel annotated with the median days spent in each stage."""
+    if funnel.empty or not funnel['reached'].iloc[0]:
+        return None
+    
+    median_days = dict(zip(time_in_stage['status'], time_in_stage['median_days']))
+    hover = [
+        f"median {median_days[stage]:.1f} days in stage" if stage in median_days else "no completed stays yet"
+        for stage in funnel['stage']
+    ]
+    
+    fig = go.Figure(go.Funnel(
+        y=funnel['stage'],
+        x=funnel['reached'],
+        textinfo='value+percent initial',
+        customdata=hover,
+        hovertemplate='%{y}: %{x} applications<br>%{customdata}<extra></extra>',
+        marker=dict(color=[STATUS_COLORS.get(stage, '#6b7280') for stage in funnel['stage']])
+    ))
+    
+    fig.update_layout(title="Pipeline Funnel", height=400)
+    return fig
+
+def format_amount(value: float) -> str:
+    """Format a salary compactly, e.g. 125000 -> '125k' and 1500000 -> '1.5M'."""
+    if abs(value) >= 1e6:
+        return f"{value / 1e6:.3g}M"
+    if abs(value) >= 1e3:
+        return f"{value / 1e3:.3g}k"
+    return f"{value:.0f}"
+
+@cached_figure
+def create_salary_chart(histogram: pd.DataFrame, currency: str):
+    """Create a histogram of annual salaries from pre-binned counts."""
+    if histogram.empty:
+        return None
+    
+    labels = [
+        f"{format_amount(low)}–{format_amount(high)}"
+        for low, high in zip(histogram['salary_from'], histogram['salary_to'])
+    ]
+    fig = go.Figure(data=[go.Bar(
+        x=(histogram['salary_from'] + histogram['salary_to']) / 2,
+        y=histogram['count'],
+        width=histogram['salary_to'] - histogram['salary_from'],
+        customdata=labels,
+        hovertemplate='%{customdata}<br>%{y} applications<extra></extra>',
+        marker_color='#8b5cf6'
+    )])
+    
+    fig.update_layout(
+        title=f"Salary Distribution ({currency}, annual midpoint)",
+        xaxis_title=f"Annual Salary ({currency})",
+        yaxis_title="Number of Applications",
+        bargap=0.05,
+        height=400
+    )
+    return fig
+
 def filter_dataframe(df: pd.DataFrame, search_term: str, status_filter: list, date_range: tuple) -> pd.DataFrame:
-    """Filter dataframe based on search criteria."""
+    """Filter a typed applications dataframe based on search criteria.
+    
+    Expects application_date as datetime64, as loaded by DatabaseManager. The
+    input frame is never modified, since cached frames are shared.
+    """
     if df.empty:
         return df
     
-    filtered_df = df.copy()
+    mask = pd.Series(True, index=df.index)
     
     # Text search
     if search_term:
-        filtered_df = filtered_df[
-            filtered_df['job_title'].str.contains(search_term, case=False) |
-            filtered_df['company_name'].str.contains(search_term, case=False) |
-            filtered_df['location'].str.contains(search_term, case=False)
-        ]
+        mask &= (
+            df['job_title'].str.contains(search_term, case=False) |
+            df['company_name'].str.contains(search_term, case=False) |
+            df['location'].str.contains(search_term, case=False)
+        )
     
     # Status filter
     if status_filter:
-        filtered_df = filtered_df[filtered_df['status'].isin(status_filter)]
+        mask &= df['status'].isin(status_filter)
     
     # Date range filter
     if date_range and len(date_range) == 2:
         start_date, end_date = date_range
-        filtered_df['application_date'] = pd.to_datetime(filtered_df['application_date'])
-        filtered_df = filtered_df[
-            (filtered_df['application_date'] >= pd.to_datetime(start_date)) &
-            (filtered_df['application_date'] <= pd.to_datetime(end_date))
-        ]
+        mask &= df['application_date'].between(pd.Timestamp(start_date), pd.Timestamp(end_date))
     
-    return filtered_df
+    return df[mask]
 
 def export_to_csv(df: pd.DataFrame) -> str:
     """Export dataframe to CSV format."""
     return df.to_csv(index=False)
 
+def export_csv_stream(db_manager, filters=None, compress: bool = False,
+                      chunk_size: int = EXPORT_CHUNK_SIZE):
+    """Export applications to a spooled temporary file, one cursor chunk at a time.
+    
+    Memory stays bounded by the chunk size and the spool threshold, after which
+    the file spills to disk. Returns the file rewound to the start.
+    """
+    export_file = tempfile.SpooledTemporaryFile(max_size=EXPORT_SPOOL_MAX_SIZE)
+    target = gzip.GzipFile(fileobj=export_file, mode='wb') if compress else export_file
+    text = io.TextIOWrapper(target, encoding='utf-8', newline='')
+    writer = csv.writer(text, lineterminator='\n')
+    
+    header_written = False
+    for columns, rows in db_manager.iter_applications(filters, chunk_size):
+        if not header_written:
+            writer.writerow(columns)
+            header_written = True
+        writer.writerows(rows)
+    if not header_written:
+        writer.writerow(db_manager.get_column_names())
+    
+    text.flush()
+    text.detach()
+    if compress:
+        target.close()
+    export_file.seek(0)
+    return export_file
+
 def calculate_metrics(df: pd.DataFrame) -> dict:
     """Calculate key metrics from the applications data."""
     if df.empty:
@@ -144,14 +328,6 @@ def calculate_metrics(df: pd.DataFrame) -> dict:
             'offer_rate': 0
         }
     
-    total = len(df)
-    responded = len(df[~df['status'].isin(['Applied', 'Follow-up'])])
-    interviewed = len(df[df['status'].str.contains('Interview', case=False)])
-    offered = len(df[df['status'].isin(['Offered', 'Accepted'])])
-    
-    return {
-        'total_applications': total,
-        'response_rate': (responded / total * 100) if total > 0 else 0,
-        'interview_rate': (interviewed / total * 100) if total > 0 else 0,
-        'offer_rate': (offered / total * 100) if total > 0 else 0
-    }
\ No newline at end of file
+    counts = df['status'].value_counts()
+    # Categorical value_counts also lists statuses with no applications
+    return summarize_status_counts(counts[counts > 0].to_dict())
\ No newline at end of file